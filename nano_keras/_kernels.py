@@ -0,0 +1,393 @@
+import numpy as np
+
+try:
+    from numba import njit, prange, get_num_threads
+    NUMBA_AVAILABLE: bool = True
+except ImportError:
+    NUMBA_AVAILABLE: bool = False
+
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit so the kernels below can still be defined when Numba isn't installed
+        """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+    prange = range
+
+# Controls whether the layers and optimizers use the Numba kernels. It's set to True only if Numba is installed.
+# You can set it to False if you want to use the NumPy implementations
+USE_NUMBA: bool = NUMBA_AVAILABLE
+
+try:
+    from scipy.linalg import blas
+    SCIPY_AVAILABLE: bool = True
+except ImportError:
+    SCIPY_AVAILABLE: bool = False
+
+
+def number_of_threads() -> int:
+    """Function that returns the number of threads the parallel Numba kernels run on
+
+    Returns:
+        int: Number of threads. It's 1 if Numba isn't installed
+    """
+    return get_num_threads() if NUMBA_AVAILABLE else 1
+
+
+def _fortran_operand(a: np.ndarray) -> tuple[np.ndarray, int]:
+    """Support function that returns a Fortran contiguous version of a for BLAS and whether BLAS has to transpose it.
+    C contiguous arrays are passed as their transpose, so they aren't copied
+
+    Args:
+        a (np.ndarray): Operand of the matrix multiplication
+
+    Returns:
+        tuple[np.ndarray, int]: Fortran contiguous array and the transpose flag
+    """
+    if a.flags.f_contiguous:
+        return a, 0
+    if a.flags.c_contiguous:
+        return a.T, 1
+    return np.asfortranarray(a), 0
+
+
+def matmul_blas(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Matrix multiplication that calls the BLAS sgemm or dgemm from scipy directly, skipping the dispatch of np.dot.
+    It falls back to np.dot if scipy isn't installed or a and b aren't both float32 or both float64
+
+    Args:
+        a (np.ndarray): Left matrix in the shape of (m, k)
+        b (np.ndarray): Right matrix in the shape of (k, n)
+
+    Returns:
+        np.ndarray: C contiguous output in the shape of (m, n)
+    """
+    if not SCIPY_AVAILABLE or a.dtype != b.dtype or a.dtype not in (np.float32, np.float64):
+        return np.dot(a, b)
+
+    gemm = blas.sgemm if a.dtype == np.float32 else blas.dgemm
+
+    # BLAS works on Fortran ordered arrays, so we compute b.T @ a.T, which is a @ b in C order
+    b_t, trans_a = _fortran_operand(b.T)
+    a_t, trans_b = _fortran_operand(a.T)
+
+    return gemm(1.0, b_t, a_t, trans_a=trans_a, trans_b=trans_b).T
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def conv1d_forward(x: np.ndarray, weights: np.ndarray, biases: np.ndarray, strides: int, out: np.ndarray) -> None:
+    """Conv1D feed forward kernel. It computes the weighted sum of the layer and stores it in out
+
+    Args:
+        x (np.ndarray): Input in the shape of (steps, channels)
+        weights (np.ndarray): Weights in the shape of (kernel_size * channels, filters)
+        biases (np.ndarray): Biases in the shape of (filters)
+        strides (int): By how much should the kernel move after each operation
+        out (np.ndarray): Preallocated output in the shape of (new_steps, filters)
+    """
+    channels = x.shape[1]
+    kernel_size = weights.shape[0] // channels
+    filters = weights.shape[1]
+
+    for p in prange(out.shape[0]):
+        start = p * strides
+        for f in range(filters):
+            out[p, f] = biases[f]
+        for i in range(kernel_size):
+            for c in range(channels):
+                value = x[start + i, c]
+                row = i * channels + c
+                # The filters are the innermost loop, as they are contiguous in both weights and out
+                for f in range(filters):
+                    out[p, f] += value * weights[row, f]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def pool1d_forward(x: np.ndarray, pool_size: int, strides: int, is_max: bool, out: np.ndarray, indices: np.ndarray) -> None:
+    """Pool1D feed forward kernel. It stores the pooled values in out and the steps they were taken from in indices
+
+    Args:
+        x (np.ndarray): Input in the shape of (steps, channels)
+        pool_size (int): Size of the pooling window
+        strides (int): Step the pool should take
+        is_max (bool): If set to True we use max pooling, otherwise we use min pooling
+        out (np.ndarray): Preallocated output in the shape of (new_steps, channels)
+        indices (np.ndarray): Preallocated integer array in the shape of (new_steps, channels)
+    """
+    for p in prange(out.shape[0]):
+        start = p * strides
+        for c in range(out.shape[1]):
+            best = start
+            for i in range(start + 1, start + pool_size):
+                if (x[i, c] > x[best, c]) if is_max else (x[i, c] < x[best, c]):
+                    best = i
+            out[p, c] = x[best, c]
+            indices[p, c] = best
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def pool2d_forward(x: np.ndarray, pool_height: int, pool_width: int, stride_height: int, stride_width: int, is_max: bool, out: np.ndarray, indices: np.ndarray) -> None:
+    """Pool2D feed forward kernel. It stores the pooled values in out and the indices of the flattened input they were taken from in indices
+
+    Args:
+        x (np.ndarray): Input in the shape of (height, width, channels)
+        pool_height (int): Height of the pooling window
+        pool_width (int): Width of the pooling window
+        stride_height (int): Step the pool should take along the height
+        stride_width (int): Step the pool should take along the width
+        is_max (bool): If set to True we use max pooling, otherwise we use min pooling
+        out (np.ndarray): Preallocated output in the shape of (new_height, new_width, channels)
+        indices (np.ndarray): Preallocated integer array in the shape of (new_height, new_width, channels)
+    """
+    width, channels = x.shape[1], x.shape[2]
+
+    for i in prange(out.shape[0]):
+        row = i * stride_height
+        for j in range(out.shape[1]):
+            col = j * stride_width
+            for c in range(channels):
+                best_row, best_col = row, col
+                for di in range(pool_height):
+                    for dj in range(pool_width):
+                        value = x[row + di, col + dj, c]
+                        if (value > x[best_row, best_col, c]) if is_max else (value < x[best_row, best_col, c]):
+                            best_row, best_col = row + di, col + dj
+                out[i, j, c] = x[best_row, best_col, c]
+                indices[i, j, c] = (best_row * width + best_col) * \
+                    channels + c
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def conv2d_forward(x: np.ndarray, weights: np.ndarray, kernel_height: int, kernel_width: int, stride_height: int, stride_width: int, out: np.ndarray) -> None:
+    """Direct Conv2D feed forward kernel. It reads the input windows straight from x, so the im2col columns are never created
+
+    Args:
+        x (np.ndarray): Input in the shape of (height, width, channels)
+        weights (np.ndarray): Weights in the shape of (channels * kernel_height * kernel_width, filters) with the same row order as Conv2D.im2col
+        kernel_height (int): Height of the Conv2D kernel
+        kernel_width (int): Width of the Conv2D kernel
+        stride_height (int): Step the kernel should take along the height
+        stride_width (int): Step the kernel should take along the width
+        out (np.ndarray): Preallocated output in the shape of (new_height, new_width, filters)
+    """
+    channels = x.shape[2]
+    filters = weights.shape[1]
+
+    for i in prange(out.shape[0]):
+        row = i * stride_height
+        for j in range(out.shape[1]):
+            col = j * stride_width
+            for f in range(filters):
+                out[i, j, f] = 0
+            for c in range(channels):
+                for di in range(kernel_height):
+                    for dj in range(kernel_width):
+                        value = x[row + di, col + dj, c]
+                        weights_row = (c * kernel_height + di) * \
+                            kernel_width + dj
+                        # The filters are the innermost loop, as they are contiguous in both weights and out
+                        for f in range(filters):
+                            out[i, j, f] += value * weights[weights_row, f]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def conv2d_3x3_forward(x: np.ndarray, weights: np.ndarray, out: np.ndarray) -> None:
+    """Conv2D feed forward kernel specialized for the 3x3 kernel with (1, 1) strides, which is the most common Conv2D configuration.
+    The 9 values of the window are loaded once per channel, so every output is updated with a single chain of 9 multiply-adds
+    instead of being read and written 9 times like in conv2d_forward
+
+    Args:
+        x (np.ndarray): Input in the shape of (height, width, channels)
+        weights (np.ndarray): Weights in the shape of (channels * 9, filters) with the same row order as Conv2D.im2col
+        out (np.ndarray): Preallocated output in the shape of (height - 2, width - 2, filters)
+    """
+    channels = x.shape[2]
+    filters = weights.shape[1]
+
+    for i in prange(out.shape[0]):
+        for j in range(out.shape[1]):
+            for f in range(filters):
+                out[i, j, f] = 0
+            for c in range(channels):
+                x00, x01, x02 = x[i, j, c], x[i, j + 1, c], x[i, j + 2, c]
+                x10, x11, x12 = x[i + 1, j, c], x[i + 1, j + 1, c], x[i + 1, j + 2, c]
+                x20, x21, x22 = x[i + 2, j, c], x[i + 2, j + 1, c], x[i + 2, j + 2, c]
+                row = c * 9
+                for f in range(filters):
+                    out[i, j, f] += x00 * weights[row, f] + x01 * weights[row + 1, f] + x02 * weights[row + 2, f] + \
+                        x10 * weights[row + 3, f] + x11 * weights[row + 4, f] + x12 * weights[row + 5, f] + \
+                        x20 * weights[row + 6, f] + x21 * weights[row + 7, f] + \
+                        x22 * weights[row + 8, f]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def conv2d_maxpool_forward(x: np.ndarray, weights: np.ndarray, kernel_height: int, kernel_width: int, stride_height: int, stride_width: int,
+                           pool_height: int, pool_width: int, pool_stride_height: int, pool_stride_width: int, out: np.ndarray) -> None:
+    """Fused Conv2D and MaxPool2D feed forward kernel. The weighted sums of the Conv2D are computed one pool window at a time
+    and only their max is stored in out, so the whole Conv2D output is never created
+
+    Args:
+        x (np.ndarray): Input in the shape of (height, width, channels)
+        weights (np.ndarray): Weights in the shape of (channels * kernel_height * kernel_width, filters) with the same row order as Conv2D.im2col
+        kernel_height (int): Height of the Conv2D kernel
+        kernel_width (int): Width of the Conv2D kernel
+        stride_height (int): Step the kernel should take along the height
+        stride_width (int): Step the kernel should take along the width
+        pool_height (int): Height of the pooling window
+        pool_width (int): Width of the pooling window
+        pool_stride_height (int): Step the pool should take along the height
+        pool_stride_width (int): Step the pool should take along the width
+        out (np.ndarray): Preallocated output in the shape of (pooled_height, pooled_width, filters)
+    """
+    channels = x.shape[2]
+    filters = weights.shape[1]
+
+    for i in prange(out.shape[0]):
+        weighted_sum = np.empty(filters, out.dtype)
+        for j in range(out.shape[1]):
+            for f in range(filters):
+                out[i, j, f] = -np.inf
+            for pi in range(pool_height):
+                row = (i * pool_stride_height + pi) * stride_height
+                for pj in range(pool_width):
+                    col = (j * pool_stride_width + pj) * stride_width
+                    weighted_sum[:] = 0
+                    for c in range(channels):
+                        for di in range(kernel_height):
+                            for dj in range(kernel_width):
+                                value = x[row + di, col + dj, c]
+                                weights_row = (c * kernel_height + di) * \
+                                    kernel_width + dj
+                                for f in range(filters):
+                                    weighted_sum[f] += value * \
+                                        weights[weights_row, f]
+                    for f in range(filters):
+                        if weighted_sum[f] > out[i, j, f]:
+                            out[i, j, f] = weighted_sum[f]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def im2col_2d(x: np.ndarray, kernel_height: int, kernel_width: int, stride_height: int, stride_width: int, out: np.ndarray) -> None:
+    """Conv2D im2col kernel. Every row of out is filled with a contiguous loop over the output positions
+
+    Args:
+        x (np.ndarray): Input in the shape of (height, width, channels)
+        kernel_height (int): Height of the Conv2D kernel
+        kernel_width (int): Width of the Conv2D kernel
+        stride_height (int): Step the kernel should take along the height
+        stride_width (int): Step the kernel should take along the width
+        out (np.ndarray): Preallocated output in the shape of (channels * kernel_height * kernel_width, new_height * new_width)
+    """
+    channels = x.shape[2]
+    width = (x.shape[1] - kernel_width) // stride_width + 1
+
+    for row in prange(channels * kernel_height * kernel_width):
+        c = row // (kernel_height * kernel_width)
+        di = (row // kernel_width) % kernel_height
+        dj = row % kernel_width
+        for i in range(out.shape[1] // width):
+            for j in range(width):
+                out[row, i * width + j] = x[i * stride_height + di,
+                                            j * stride_width + dj, c]
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def conv2d_forward_batch(x: np.ndarray, weights: np.ndarray, kernel_height: int, kernel_width: int, stride_height: int, stride_width: int,
+                         cols: np.ndarray, out: np.ndarray) -> None:
+    """Conv2D training feed forward kernel for a whole batch. The samples are independent, so the threads split the batch between them.
+    Every sample is transformed with im2col and multiplied right after that, so it's columns are still in the cache.
+    np.dot in Numba calls BLAS through scipy, so it should only be used if scipy is installed
+
+    Args:
+        x (np.ndarray): Input in the shape of (batch_size, height, width, channels)
+        weights (np.ndarray): Weights in the shape of (channels * kernel_height * kernel_width, filters)
+        kernel_height (int): Height of the Conv2D kernel
+        kernel_width (int): Width of the Conv2D kernel
+        stride_height (int): Step the kernel should take along the height
+        stride_width (int): Step the kernel should take along the width
+        cols (np.ndarray): Preallocated im2col output in the shape of (batch_size, channels * kernel_height * kernel_width, new_height * new_width)
+        out (np.ndarray): Preallocated output in the shape of (batch_size, new_height * new_width, filters)
+    """
+    channels = x.shape[3]
+    width = (x.shape[2] - kernel_width) // stride_width + 1
+    height = cols.shape[2] // width
+
+    for n in prange(x.shape[0]):
+        for row in range(channels * kernel_height * kernel_width):
+            c = row // (kernel_height * kernel_width)
+            di = (row // kernel_width) % kernel_height
+            dj = row % kernel_width
+            for i in range(height):
+                for j in range(width):
+                    cols[n, row, i * width + j] = x[n, i * stride_height + di,
+                                                    j * stride_width + dj, c]
+
+        out[n] = np.dot(cols[n].T, weights)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def adamax_step(m: np.ndarray, u: np.ndarray, gradients: np.ndarray, params: np.ndarray, beta1: float, beta2: float,
+                learning_rate: float, epsilon: float) -> None:
+    """AdaMax update kernel used by optimizers.AdaMax. It updates the moments and the params in a single pass over the arrays
+
+    Args:
+        m (np.ndarray): Flattened exponential moving average of the gradient
+        u (np.ndarray): Flattened exponentially weighted infinity norm of the gradient
+        gradients (np.ndarray): Flattened gradients of the params
+        params (np.ndarray): Flattened params to update
+        beta1 (float): Decay rate of m
+        beta2 (float): Decay rate of u
+        learning_rate (float): Learning rate with the bias correction already applied
+        epsilon (float): Value added to u so we don't divide by 0
+    """
+    for i in prange(params.size):
+        m_i = beta1 * m[i] + (1 - beta1) * gradients[i]
+        u_i = max(beta2 * u[i], abs(gradients[i]))
+        m[i] = m_i
+        u[i] = u_i
+        params[i] += learning_rate * m_i / (u_i + epsilon)
+
+
+@njit(fastmath=True, cache=True)
+def dense_int8_forward(x: np.ndarray, weights: np.ndarray, scale: np.ndarray, out: np.ndarray) -> None:
+    """Dense feed forward kernel for int8 weights created by Dense.quantize(). The weights are dequantized while they're read,
+    so only the int8 weights have to be loaded from memory. It stores the weighted sum without the biases in out
+
+    Args:
+        x (np.ndarray): Input in the shape of (input_shape)
+        weights (np.ndarray): int8 weights in the shape of (input_shape, units)
+        scale (np.ndarray): Scale of every output neuron in the shape of (units)
+        out (np.ndarray): Preallocated output in the shape of (units)
+    """
+    out[:] = 0
+    # Going over the weights row by row keeps the inner loop contiguous, so it can be vectorized
+    for i in range(x.shape[0]):
+        value = x[i]
+        for j in range(out.shape[0]):
+            out[j] += value * np.float32(weights[i, j])
+
+    for j in range(out.shape[0]):
+        out[j] *= scale[j]
+
+
+@njit(fastmath=True, cache=True)
+def dense_bfloat16_forward(x: np.ndarray, weight_bits: np.ndarray, out: np.ndarray) -> None:
+    """Dense feed forward kernel for bfloat16 weights created by Dense.quantize(). Numba doesn't support bfloat16, so it gets the raw bits of the weights.
+    bfloat16 is the upper half of float32, so every row is converted by shifting the bits into a float32 buffer. It stores the weighted sum without the biases in out
+
+    Args:
+        x (np.ndarray): Input in the shape of (input_shape)
+        weight_bits (np.ndarray): Weights viewed as np.uint16 in the shape of (input_shape, units)
+        out (np.ndarray): Preallocated output in the shape of (units)
+    """
+    bits = np.empty(out.shape[0], np.uint32)
+    row = bits.view(np.float32)
+
+    out[:] = 0
+    for i in range(x.shape[0]):
+        value = x[i]
+        for j in range(out.shape[0]):
+            bits[j] = np.uint32(weight_bits[i, j]) << 16
+        for j in range(out.shape[0]):
+            out[j] += value * row[j]
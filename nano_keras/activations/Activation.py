@@ -1,26 +1,55 @@
+import inspect
 import numpy as np
 
 
 class Activation:
     """Base class for all activation functions
     """
+    # Whether apply_activation of each activation class takes in the out param, so the signature is only inspected once
+    _supports_out: dict = {}
 
     def __init__(self) -> None:
         """Initalizer for most activation function that don't have any special params like LeakyReLU or ELU
         """
         self.e = 1e-7
 
-    def apply_activation(self, X: np.ndarray) -> np.ndarray:
+    def apply_activation(self, X: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """Base activation class implementation of compute loss function
 
         Args:
             X (np.ndarray): Data to apply activation function on
+            out (np.ndarray, optional): Array to store the output in. It must have the same shape as X, but it can't be the same array. Defaults to None.
 
         Returns:
             np.ndarray: Data with activation function applied to them
         """
         pass
 
+    def apply_activation_into(self, X: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Function used by the layers to apply the activation function into their buffers. Custom activations can implement
+        apply_activation without the out param, in which case their output is copied into out
+
+        Args:
+            X (np.ndarray): Data to apply activation function on
+            out (np.ndarray, optional): Array to store the output in. It must have the same shape as X, but it can't be the same array. Defaults to None.
+
+        Returns:
+            np.ndarray: Data with activation function applied to them
+        """
+        if out is None:
+            return self.apply_activation(X)
+
+        if type(self) not in Activation._supports_out:
+            parameters = inspect.signature(self.apply_activation).parameters.values()
+            Activation._supports_out[type(self)] = any(
+                parameter.name == "out" or parameter.kind == parameter.VAR_KEYWORD for parameter in parameters)
+
+        if Activation._supports_out[type(self)]:
+            return self.apply_activation(X, out=out)
+
+        out[...] = self.apply_activation(X)
+        return out
+
     def compute_derivative(self, X: np.ndarray) -> np.ndarray:
         """Base activation class implementation of the derivative of apply_activation
 
@@ -15,16 +15,25 @@ class ELU(Activation):
         super(ELU, self).__init__()
         self.alpha: float = alpha
 
-    def apply_activation(self, X: np.ndarray) -> np.ndarray:
+    def apply_activation(self, X: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """Function to apply ELU activation on given data
 
         Args:
             X (np.ndarray): Data to apply activation function on
+            out (np.ndarray, optional): Array to store the output in. It must have the same shape as X, but it can't be the same array. Defaults to None.
 
         Returns:
             np.ndarray: Data with activation function applied to them
         """
-        return np.where(X > 0, X, self.alpha * np.exp(X) - 1)
+        output = np.exp(X, out=out)
+        output *= self.alpha
+        output -= 1
+
+        if out is None:
+            return np.where(X > 0, X, output)
+
+        np.copyto(out, X, where=X > 0)
+        return out
 
     def compute_derivative(self, X: np.ndarray) -> np.ndarray:
         """Function to apply derivative of ELU activation on given data
@@ -15,16 +15,17 @@ class LeakyReLU(Activation):
         super().__init__()
         self.alpha: float = alpha
 
-    def apply_activation(self, X: np.ndarray) -> np.ndarray:
+    def apply_activation(self, X: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """Function to apply LeakyReLU activation on given data
 
         Args:
             X (np.ndarray): Data to apply activation function on
+            out (np.ndarray, optional): Array to store the output in. It must have the same shape as X, but it can't be the same array. Defaults to None.
 
         Returns:
             np.ndarray: Data with activation function applied to them
         """
-        return np.maximum(self.alpha*X, X)
+        return np.maximum(self.alpha*X, X, out=out)
 
     def compute_derivative(self, X: np.ndarray) -> np.ndarray:
         """Function to apply derivative of LeakyReLU activation on given data
@@ -5,17 +5,18 @@ from nano_keras.activations import Activation
 class ReLU(Activation):
     """ReLU activation function
     """    
-    def apply_activation(self, X: np.ndarray) -> np.ndarray:
+    def apply_activation(self, X: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """Function to apply ReLU activation on given data
 
         Args:
             X (np.ndarray): Data to apply activation function on
+            out (np.ndarray, optional): Array to store the output in. It must have the same shape as X, but it can't be the same array. Defaults to None.
 
         Returns:
             np.ndarray: Data with activation function applied to them
         """
         super(ReLU, self).__init__()
-        return np.maximum(0.0, X)
+        return np.maximum(0.0, X, out=out)
 
     def compute_derivative(self, X: np.ndarray) -> np.ndarray:
         """Function to apply derivative of tanh activation on given data
@@ -6,16 +6,20 @@ class Sigmoid(Activation):
     """Sigmoid activation function
     """
 
-    def apply_activation(self, X: np.ndarray) -> np.ndarray:
+    def apply_activation(self, X: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """Function to apply sigmoid activation on given data
 
         Args:
             X (np.ndarray): Data to apply activation function on
+            out (np.ndarray, optional): Array to store the output in. It must have the same shape as X, but it can't be the same array. Defaults to None.
 
         Returns:
             np.ndarray: Data with activation function applied to them
         """
-        return 1 / (1 + np.exp(-X + self.e))
+        output = np.subtract(self.e, X, out=out)
+        output = np.exp(output, out=out)
+        output += 1
+        return np.reciprocal(output, out=out)
 
     def compute_derivative(self, X: np.ndarray) -> np.ndarray:
         """Function to apply derivative of sigmoid activation on given data
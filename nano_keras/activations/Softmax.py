@@ -6,17 +6,19 @@ class Softmax(Activation):
     """Softmax activation function
     """
 
-    def apply_activation(self, X: np.ndarray) -> np.ndarray:
+    def apply_activation(self, X: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """Function to apply softmax activation on given data
 
         Args:
             X (np.ndarray): Data to apply activation function on
+            out (np.ndarray, optional): Array to store the output in. It must have the same shape as X, but it can't be the same array. Defaults to None.
 
         Returns:
             np.ndarray: Data with activation function applied to them
         """
-        ex = np.exp(X - np.max(X) + self.e)
-        return ex / ex.sum(axis=0)
+        ex = np.exp(X - np.max(X) + self.e, out=out)
+        ex /= ex.sum(axis=0)
+        return ex
 
     def compute_derivative(self, X: np.ndarray) -> np.ndarray:
         """Function to apply derivative of softmax activation on given data
@@ -6,17 +6,19 @@ class Tanh(Activation):
     """Tanh activation function
     """
 
-    def apply_activation(self, X: np.ndarray) -> np.ndarray:
+    def apply_activation(self, X: np.ndarray, out: np.ndarray = None) -> np.ndarray:
         """Function to apply tanh activation on given data
 
         Args:
             X (np.ndarray): Data to apply activation function on
+            out (np.ndarray, optional): Array to store the output in. It must have the same shape as X, but it can't be the same array. Defaults to None.
 
         Returns:
             np.ndarray: Data with activation function applied to them
         """
-        output = (np.exp(X) - np.exp(-X)) / \
-            np.nan_to_num(np.exp(X) + np.exp(-X) + self.e, copy=False)
+        exp_x, exp_minus_x = np.exp(X), np.exp(-X)
+        output = np.subtract(exp_x, exp_minus_x, out=out)
+        output /= np.nan_to_num(exp_x + exp_minus_x + self.e, copy=False)
         return output
 
     def compute_derivative(self, X: np.ndarray) -> np.ndarray:
@@ -27,16 +27,73 @@ class RandomInitializer(Initializer):
     """Base class for all the initializers which use some randomness in them like Random Normal, He Uniform, Xavier Normal, etc.
     """
 
-    def __init__(self, mu: float = 0, sigma: float = 0.1) -> None:
+    def __init__(self, mu: float = 0, sigma: float = 0.1, seed: int = None) -> None:
         """Initalizer for all the initializers which use some randomness in them like Random Normal, He Uniform, Xavier Normal, etc.
 
         Args:
             mu (float, optional): mean of the uniform distribution. Defaults to 0.
             sigma (float, optional): standard deviation, half-width of the distribution. Defaults to 0.1.
             The generated number will be between mu and mu + selfsigma.
+            seed (int, optional): Seed of the random generator. If it's None the generator is seeded from NumPy's global random state,
+            so np.random.seed() still makes the parameters reproducible. Defaults to None.
         """
         self.mu = mu
         self.sigma = sigma
+        self.rng: np.random.Generator = np.random.default_rng(
+            seed) if seed is not None else None
+
+    def generator(self) -> np.random.Generator:
+        """Function that returns the random generator used to generate the parameters.
+        We use np.random.Generator as it can generate float32 numbers directly and it's PCG64 is faster than the legacy Mersenne Twister
+
+        Returns:
+            np.random.Generator: Seeded generator or a new generator seeded from NumPy's global random state
+        """
+        if self.rng is not None:
+            return self.rng
+        return np.random.default_rng(np.random.randint(2**31))
+
+    @staticmethod
+    def generator_dtype(datatype: np.float_) -> np.float_:
+        """Support function that returns the data type the generator should use. It only supports float32 and float64,
+        so float16 parameters are generated in float32 and cast after that
+
+        Args:
+            datatype (np.float_): Datatype in which you want to store the parameters
+
+        Returns:
+            np.float_: np.float32 or np.float64
+        """
+        return np.float64 if datatype == np.float64 else np.float32
+
+    def standard_normal(self, shape: tuple, datatype: np.float_) -> np.ndarray:
+        """Function that generates the parameters in the shape of 'shape' using the standard normal distribution
+
+        Args:
+            shape (tuple): Shape of the output
+            datatype (np.float_): Datatype in which you want to store the parameters
+
+        Returns:
+            np.ndarray: Generated output in float32 or float64
+        """
+        return self.generator().standard_normal(shape, self.generator_dtype(datatype))
+
+    def uniform(self, low: float, high: float, shape: tuple, datatype: np.float_) -> np.ndarray:
+        """Function that generates the parameters in the shape of 'shape' using the uniform distribution between low and high
+
+        Args:
+            low (float): Lower bound of the distribution
+            high (float): Upper bound of the distribution
+            shape (tuple): Shape of the output
+            datatype (np.float_): Datatype in which you want to store the parameters
+
+        Returns:
+            np.ndarray: Generated output in float32 or float64
+        """
+        output = self.generator().random(shape, self.generator_dtype(datatype))
+        output *= high - low
+        output += low
+        return output
 
     @staticmethod
     def compute_fans(shape: tuple) -> tuple:
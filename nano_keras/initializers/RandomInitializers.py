@@ -16,7 +16,7 @@ class RandomNormal(RandomInitializer):
         Returns:
             np.ndarray: Generated output using normal distribution
         """
-        return np.random.normal(size=shape).astype(datatype)
+        return self.standard_normal(shape, datatype).astype(datatype, copy=False)
 
 
 class RandomUniform(RandomInitializer):
@@ -33,7 +33,7 @@ class RandomUniform(RandomInitializer):
         Returns:
             np.ndarray: Generated output using uniform distribution
         """
-        return np.random.uniform(self.mu, self.sigma, shape).astype(datatype)
+        return self.uniform(self.mu, self.sigma, shape, datatype).astype(datatype, copy=False)
 
 
 class HeNormal(RandomInitializer):
@@ -54,9 +54,9 @@ class HeNormal(RandomInitializer):
         [He et al., 2015](https://arxiv.org/abs/1502.01852)
         """
         fan_in, _ = self.compute_fans(shape)
-        output = np.random.normal(size=shape)
+        output = self.standard_normal(shape, datatype)
         output *= np.sqrt(2./fan_in)
-        return output.astype(datatype)
+        return output.astype(datatype, copy=False)
 
 
 class HeUniform(RandomInitializer):
@@ -78,8 +78,8 @@ class HeUniform(RandomInitializer):
         """
         fan_in, _ = self.compute_fans(shape)
         limit = np.sqrt(6. / fan_in)
-        output = np.random.uniform(-limit, limit, shape)
-        return output.astype(datatype)
+        output = self.uniform(-limit, limit, shape, datatype)
+        return output.astype(datatype, copy=False)
 
 
 class XavierNormal(RandomInitializer):
@@ -100,10 +100,11 @@ class XavierNormal(RandomInitializer):
         [Glorot et al., 2010](http://proceedings.mlr.press/v9/glorot10a.html)
         """
         fan_in, _ = self.compute_fans(shape)
-        output = np.random.normal(size=shape)
-        output = 2 * output - 1
+        output = self.standard_normal(shape, datatype)
+        output *= 2
+        output -= 1
         output *= np.sqrt(6 / fan_in)
-        return output.astype(datatype)
+        return output.astype(datatype, copy=False)
 
 
 class XavierUniform(RandomInitializer):
@@ -125,5 +126,5 @@ class XavierUniform(RandomInitializer):
         """
         fan_in, fan_out = self.compute_fans(shape)
         limit = np.sqrt(6. / (fan_in + fan_out))
-        output = np.random.uniform(-limit, limit, shape)
-        return output.astype(datatype)
+        output = self.uniform(-limit, limit, shape, datatype)
+        return output.astype(datatype, copy=False)
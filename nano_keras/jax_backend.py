@@ -0,0 +1,141 @@
+import numpy as np
+from typing import Callable
+from nano_keras.activations import Activation, Sigmoid, Tanh, ReLU, LeakyReLU, ELU, Softmax
+from nano_keras.layers import Layer, Input, Dense, Dropout, Flatten, Reshape, Conv1D
+
+try:
+    import jax
+    import jax.numpy as jnp
+    JAX_AVAILABLE: bool = True
+except ImportError:
+    JAX_AVAILABLE: bool = False
+
+
+def activation_to_jax(activation: Activation) -> Callable:
+    """Support function that returns the jax.numpy version of the given activation function
+
+    Args:
+        activation (Activation): Activation function of the layer
+
+    Raises:
+        ValueError: If the activation function doesn't have a jax.numpy version
+
+    Returns:
+        Callable: Function that applies the activation on a jax array
+    """
+    e = activation.e
+
+    if isinstance(activation, Sigmoid):
+        return lambda X: 1 / (1 + jnp.exp(e - X))
+    if isinstance(activation, Tanh):
+        return lambda X: (jnp.exp(X) - jnp.exp(-X)) / jnp.nan_to_num(jnp.exp(X) + jnp.exp(-X) + e)
+    if isinstance(activation, LeakyReLU):
+        return lambda X: jnp.maximum(activation.alpha * X, X)
+    if isinstance(activation, ReLU):
+        return lambda X: jnp.maximum(0, X)
+    if isinstance(activation, ELU):
+        return lambda X: jnp.where(X > 0, X, activation.alpha * jnp.exp(X) - 1)
+    if isinstance(activation, Softmax):
+        def softmax(X):
+            ex = jnp.exp(X - jnp.max(X) + e)
+            return ex / ex.sum(axis=0)
+        return softmax
+
+    raise ValueError(
+        f"Activation {type(activation).__name__} isn't supported by the jax backend")
+
+
+def layer_to_jax(layer: Layer) -> Callable:
+    """Support function that returns the jax.numpy version of the given layers feed forward. It only covers the inference feed forward,
+    so Dropout doesn't apply it's mask
+
+    Args:
+        layer (Layer): Layer of the model
+
+    Raises:
+        ValueError: If the layer doesn't have a jax.numpy version
+
+    Returns:
+        Callable: Function that takes in the layers params and x and returns the output of the layer
+    """
+    if isinstance(layer, Input):
+        return lambda params, x: x
+    if isinstance(layer, Flatten):
+        return lambda params, x: x.reshape(-1)
+    if isinstance(layer, Reshape):
+        return lambda params, x: x.reshape(layer.target_shape)
+    if isinstance(layer, (Dense, Dropout)):
+        activation = activation_to_jax(layer.activation)
+        return lambda params, x: activation(jnp.dot(x, params[0]) + params[1])
+    if isinstance(layer, Conv1D):
+        activation = activation_to_jax(layer.activation)
+        kernel_size, strides = layer.kernel_size, layer.strides
+
+        def conv1d(params, x):
+            steps = (x.shape[0] - kernel_size) // strides + 1
+            # Gathering the windows with static indices lets XLA turn im2col into a single gather
+            indices = np.arange(steps)[:, None] * strides + \
+                np.arange(kernel_size)[None, :]
+            cols = x[indices].reshape(steps, -1)
+            return activation(cols @ params[0] + params[1])
+        return conv1d
+
+    raise ValueError(
+        f"Layer {layer.name} of type {type(layer).__name__} isn't supported by the jax backend")
+
+
+def get_params(layers: list[Layer]) -> list[tuple]:
+    """Function that converts the weights and biases of the model into jax arrays, so they can be passed into the jitted feed forward
+
+    Args:
+        layers (list[Layer]): Layers of the model
+
+    Returns:
+        list[tuple]: Weights and biases of each layer. Layers without params get an empty tuple
+    """
+    params = []
+    for layer in layers:
+        if not isinstance(layer, (Dense, Dropout, Conv1D)):
+            params.append(())
+            continue
+
+        weights = layer.weights
+        if weights.dtype == np.int8:
+            weights = weights.astype(np.float32) * layer.weights_scale
+        elif weights.dtype not in (np.float32, np.float64):
+            # float16 and bfloat16 weights are only used for storage
+            weights = weights.astype(np.float32)
+
+        biases = layer.biases.astype(
+            np.float32) if layer.biases.dtype == np.float16 else layer.biases
+
+        params.append((jnp.asarray(weights), jnp.asarray(biases)))
+
+    return params
+
+
+def build_feed_forward(layers: list[Layer]) -> Callable:
+    """Function that builds the feed forward of the whole model using jax.numpy and compiles it with jax.jit,
+    so XLA can fuse the dot products, bias adds and activations of the layers
+
+    Args:
+        layers (list[Layer]): Layers of the model
+
+    Raises:
+        ImportError: If jax isn't installed
+
+    Returns:
+        Callable: Jitted function that takes in the params from get_params and x and returns the output of the model
+    """
+    if not JAX_AVAILABLE:
+        raise ImportError(
+            "The jax backend requires jax to be installed. You can install it using: pip install jax")
+
+    layer_functions = [layer_to_jax(layer) for layer in layers]
+
+    def feed_forward(params: list[tuple], x: jnp.ndarray) -> jnp.ndarray:
+        for layer_function, layer_params in zip(layer_functions, params):
+            x = layer_function(layer_params, x)
+        return x
+
+    return jax.jit(feed_forward)
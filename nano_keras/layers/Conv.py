@@ -1,8 +1,10 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from nano_keras import _kernels
 from nano_keras.layers import Layer, LayerWithParams
 from nano_keras.optimizers import Optimizer
 from nano_keras.regulizers import Regularizer
-from nano_keras.activations import Activation, ACTIVATIONS
+from nano_keras.activations import Activation, ACTIVATIONS, ReLU, LeakyReLU, Sigmoid, Tanh
 from nano_keras.initializers import Initializer, INITIALIZERS
 
 
@@ -10,7 +12,7 @@ class Conv1D(LayerWithParams):
     """Conv1D layer class. The input shape is (None, steps, channels) and the output shape is (None, new_steps, filters)
     """
 
-    def __init__(self, filters: int = 1, kernel_size: int = 2, strides: int = 2, activation: Activation | str = "relu", weight_initialization: str = "he", regulizer: Regularizer = None, trainable: bool = True, input_shape: tuple = None, name: str = "Conv1D") -> None:
+    def __init__(self, filters: int = 1, kernel_size: int = 2, strides: int = 2, activation: Activation | str = "relu", weight_initialization: Initializer | str = "he_normal", regulizer: Regularizer = None, trainable: bool = True, input_shape: tuple = None, name: str = "Conv1D") -> None:
         """Initalizer for the Conv1D layer
 
         Args:
@@ -18,7 +20,7 @@ class Conv1D(LayerWithParams):
             kernel_size (int, optional): Kernel size the model should use. Defaults to 2.
             strides (int, optional): By how much should the kernel move after each operation. Defaults to 2.
             activation (Activation | str, optional): Activation function the layer should use. Defaults to "relu".
-            weight_initaliziton (str, optional): Weights intialization strategy you want to use to generate weights of the layer. Your options are: random, xavier, he. Defalut to "he"
+            weight_initaliziton (Initializer | str, optional): Weights intialization strategy you want to use to generate weights of the layer. Your options are: random_normal, xavier_normal, he_normal. Defalut to "he_normal"
             regulizer (Regularizer, optional): Regulizer of the layer. Defaults to None.
             trainable (bool, optional): Parameter that decides whether the parameters should be updated or no. Defaults to True.
             input_shape (tuple, optional): Input shape to the layer. Used if you dont't want to use Input layer. If it's None it won't be used. Defaults to None.
@@ -27,45 +29,124 @@ class Conv1D(LayerWithParams):
         self.number_of_filters: int = filters
         self.kernel_size: int = kernel_size
         self.strides: int = strides
-        self.activation: Activation = ACTIVATIONS[activation] if type(
-            activation) == str else activation
-        self.weights: np.ndarray = np.random.randn(filters, self.kernel_size)
+        self.activation: Activation = ACTIVATIONS[activation] if isinstance(
+            activation, str) else activation
+        self.weights: np.ndarray = np.array([])
         self.biases: np.ndarray = np.random.randn(filters)
-        self.weight_initialization = weight_initialization
+        self.weight_initialization: Initializer = INITIALIZERS[weight_initialization] if isinstance(
+            weight_initialization, str) else weight_initialization
         self.regulizer: Regularizer = regulizer
         self.trainable: bool = trainable
         self.input_shape = input_shape
         self.name: str = name
 
+        # Inference buffers allocated by Conv1D.bind_buffers
+        self._weighted_sum: np.ndarray = None
+        self._out: np.ndarray = None
+
+    def generate_weights(self, layers: list[Layer], current_layer_index: int, weight_data_type: np.float_, bias_data_type: np.float_) -> None:
+        """Function used for weights generation for Conv1D layer. The weights are stored as a 2d matrix with the shape of (kernel_size * input_shape[-1], number_of_filters),
+        so the filters are the contiguous axis of the matrix multiplication in the feed forward
+
+        Args:
+            layers (list): All layers in the model
+            current_layer_index (int): For what layer do we want to generate the weights
+            weight_data_type (np.float_): In what data type do you want to store the weights. Only use datatypes like np.float32 and np.float64
+            bias_data_type (np.float_): In what data type do you want to store the biases. Only use datatypes like np.float32 and np.float64
+        """
+        input_shape = self.previous_output_shape(
+            layers, current_layer_index) if self.input_shape is None else self.input_shape
+
+        weights_shape = (self.kernel_size * input_shape[-1],
+                         self.number_of_filters)
+
+        self.weights = self.weight_initialization(
+            weights_shape, weight_data_type)
+
+        self.biases = self.biases.astype(bias_data_type)
+
     def output_shape(self, layers: list[Layer], current_layer_index: int) -> tuple:
-        input_shape = layers[current_layer_index -
-                             1].output_shape(layers, current_layer_index-1) if self.input_shape is None else self.input_shape
-        self.output_shape_value: tuple = tuple(
-            input_shape).size // self.strides, self.number_of_filters
+        input_shape = self.previous_output_shape(
+            layers, current_layer_index) if self.input_shape is None else self.input_shape
+        self.output_shape_value: tuple = (
+            (input_shape[0] - self.kernel_size) // self.strides + 1, self.number_of_filters)
         return self.output_shape_value
 
+    def bind_buffers(self, layers: list[Layer], current_layer_index: int) -> None:
+        dtype = np.float32 if self.weights.dtype == np.float16 else self.weights.dtype
+
+        self._weighted_sum = np.empty(
+            self.output_shape(layers, current_layer_index), np.result_type(dtype, self.biases))
+        self._out = np.empty_like(self._weighted_sum)
+
     def __repr__(self) -> str:
         formatted_output = f'(None, {", ".join(map(str, self.output_shape_value))})'
         return f"{self.name} (Conv1D){' ' * (28 - len(self.name) - 8)}{formatted_output}{' ' * (26-len(formatted_output))}{self.weights.size + self.biases.size}\n"
 
+    def im2col(self, x: np.ndarray) -> np.ndarray:
+        """Support function to perform im2col operation for input data in Conv1D feed forward.
+        Every row of the output is one kernel sized window of the input, so the convolution becomes a single matrix multiplication
+
+        Args:
+            x (np.ndarray): Data we should perform the operation on. It should be 2d: steps, channels
+
+        Returns:
+            np.ndarray: Columns in the shape of (new_steps, kernel_size * channels)
+        """
+        windows = sliding_window_view(
+            x, self.kernel_size, axis=0)[::self.strides]
+
+        return windows.transpose(0, 2, 1).reshape(windows.shape[0], -1)
+
     def __call__(self, x: np.ndarray, is_training: bool = False) -> np.ndarray:
+        """Feed forward function for the Conv1D layer\n
+        Note that after NN.compile() the inference output is the buffer from Conv1D.bind_buffers, which is overwritten by the next call.
+        Copy it if you call the layer directly and want to keep the output. NN.feed_forward() and NN.evaluate() already do that
+
+        Args:
+            x (np.ndarray): X dataset
+            is_training (bool): Determines whether the layer should behave like in the training loop or no. Defaults to False.
+
+        Returns:
+            np.ndarray: Output of the layer
+        """
+        # Half precision parameters are only used for storage, as NumPy doesn't compute in float16 on most CPUs
+        weights = self.weights.astype(
+            np.float32) if self.weights.dtype == np.float16 else self.weights
+        biases = self.biases.astype(
+            np.float32) if self.biases.dtype == np.float16 else self.biases
+
+        # Casting x to the dtype of the weights, so a float64 x doesn't silently upcast the whole layer
+        x = x.astype(weights.dtype, copy=False)
         self.inputs: np.ndarray = x
 
-        weighted_sum = np.zeros(
-            (x.size // self.strides, self.number_of_filters))
+        steps = (x.shape[0] - self.kernel_size) // self.strides + 1
 
-        for i in range(0, x.size, self.strides):
-            if i + self.kernel_size > x.size:
-                break  # Reached the end of the input
+        # During inference we write into the buffers from Conv1D.bind_buffers instead of allocating new arrays
+        use_buffers = not is_training and self._weighted_sum is not None and self._weighted_sum.shape[0] == steps and \
+            self._weighted_sum.dtype == np.result_type(x, weights, biases)
 
-            for j in range(len(self.weights)):
-                weighted_sum[i //
-                             self.strides, j] = np.sum(x[i:i+self.kernel_size, :] * self.weights[j])
+        if use_buffers:
+            weighted_sum = self._weighted_sum
+        else:
+            weighted_sum = np.empty(
+                (steps, self.number_of_filters), np.result_type(x, weights, biases))
 
-        weighted_sum = weighted_sum + self.biases
+        if _kernels.USE_NUMBA:
+            # The columns aren't needed by the kernel, so they are only computed in backpropagate
+            self.cols: np.ndarray = None
 
-        output = self.activation.apply_activation(weighted_sum)
-        self.outputs: np.ndarray = np.array([output, weighted_sum])
+            _kernels.conv1d_forward(
+                x, weights, biases, self.strides, weighted_sum)
+        else:
+            self.cols: np.ndarray = self.im2col(x)
+
+            np.matmul(self.cols, weights, out=weighted_sum)
+            weighted_sum += biases
+
+        output = self.activation.apply_activation_into(
+            weighted_sum, self._out) if use_buffers else self.activation.apply_activation(weighted_sum)
+        self.outputs: tuple[np.ndarray, np.ndarray] = (output, weighted_sum)
 
         return output
 
@@ -84,26 +165,28 @@ class Conv1D(LayerWithParams):
             gradient = self.regulizer.update_gradient(
                 gradient, self.weights, self.biases)
 
-        delta = np.average(
-            [gradient * self.activation.compute_derivative(output) for output in self.outputs])
+        # Derivative of the activation with respect to the weighted sum
+        delta = gradient * self.activation.compute_derivative(self.outputs[1])
 
-        # weights_gradients = delta * self.weights
-        weights_gradients = np.zeros(
-            (self.inputs.size // self.strides, self.number_of_filters))
+        cols = self.im2col(self.inputs) if self.cols is None else self.cols
 
-        for i in range(0, self.inputs.size, self.strides):
-            if i + self.kernel_size > self.inputs.size:
-                break  # Reached the end of the input
+        weights_gradients = cols.T @ delta
 
-            for j in range(len(self.weights)):
-                weights_gradients[i //
-                                  self.strides, j] = np.sum(self.inputs[i:i+self.kernel_size, j:j+self.kernel_size] * delta)
+        # col2im, every kernel position adds its part of the gradient to the steps it was applied to
+        cols_gradient = (delta @ self.weights.T).reshape(
+            delta.shape[0], self.kernel_size, -1)
+        output_gradient = np.zeros_like(self.inputs, dtype=cols_gradient.dtype)
+        end = delta.shape[0] * self.strides
+
+        for i in range(self.kernel_size):
+            output_gradient[i:i+end:self.strides] += cols_gradient[:, i]
 
         if self.trainable:
-            self.weights, self.biases = optimizer[0].apply_gradients(weights_gradients, np.array(
-                delta, dtype=float), self.weights, self.biases)
+            # Every filter has it's own bias, so its gradient is averaged over the steps only
+            self.weights, self.biases = optimizer[0].apply_gradients(
+                weights_gradients, np.average(delta, axis=0), self.weights, self.biases)
 
-        return np.dot(delta, self.weights.T)
+        return output_gradient
 
 
 class Conv2D(LayerWithParams):
@@ -128,13 +211,13 @@ class Conv2D(LayerWithParams):
         self.number_of_filters: int = filters
         self.kernel_size: tuple = kernel_size
         self.strides: tuple = strides
-        self.activation: Activation = ACTIVATIONS[activation] if type(
-            activation) == str else activation
+        self.activation: Activation = ACTIVATIONS[activation] if isinstance(
+            activation, str) else activation
 
-        self.weight_initialization: Initializer = weight_initialization if type(
-            weight_initialization) == Initializer else INITIALIZERS[weight_initialization]
-        self.bias_initialization: Initializer = bias_initialization if type(
-            bias_initialization) == Initializer else INITIALIZERS[bias_initialization]
+        self.weight_initialization: Initializer = weight_initialization if isinstance(
+            weight_initialization, Initializer) else INITIALIZERS[weight_initialization]
+        self.bias_initialization: Initializer = bias_initialization if isinstance(
+            bias_initialization, Initializer) else INITIALIZERS[bias_initialization]
         self.trainable: bool = trainable
 
         self.regulizer: Regularizer = regulizer
@@ -143,26 +226,37 @@ class Conv2D(LayerWithParams):
         self.weights: np.ndarray = np.array([])
         self.biases: np.ndarray = np.array([])
 
+        # MaxPool2D layer fused into the inference feed forward of NN. It's set by NN.compile using Conv2D.fuse_pool
+        self.fused_pool: Layer = None
+
+        # (weights, weights_col, weights_col.T) cached by Conv2D._weights_col
+        self._weights_cache: tuple = None
+
         self.current_batch = 0
 
     def set_batch_size(self, batch_size: int, layers: list, index: int) -> None:
         self.batch_size = batch_size
 
-        input_shape = layers[index-1].output_shape(
-            layers, index-1) if self.input_shape is None else self.input_shape
+        input_shape = self.previous_output_shape(
+            layers, index) if self.input_shape is None else self.input_shape
         output_shape = self.output_shape(layers, index)
 
-        self.inputs = np.ndarray((self.batch_size, *input_shape)) if type(
-            input_shape) == tuple else np.ndarray((self.batch_size, input_shape))
-        self.outputs = np.ndarray((self.batch_size, *output_shape)) if type(
-            output_shape) == tuple else np.ndarray((self.batch_size, output_shape))
+        self.inputs = np.ndarray((self.batch_size, *input_shape)) if isinstance(
+            input_shape, tuple) else np.ndarray((self.batch_size, input_shape))
+        self.outputs = np.ndarray((self.batch_size, *output_shape)) if isinstance(
+            output_shape, tuple) else np.ndarray((self.batch_size, output_shape))
 
-        x_col_indices = self.im2col_indices(input_shape)
-
-        self.x_col = np.ndarray((self.batch_size, *x_col_indices[0].shape))
+        # im2col writes the columns of every sample straight into this buffer, so backpropagate can reuse them.
+        # It uses the dtype the feed forward is computed in, so the columns don't have to be cast
+        self.x_col = np.ndarray((self.batch_size, self.kernel_size[0] * self.kernel_size[1] * input_shape[-1],
+                                 output_shape[0] * output_shape[1]), np.float32 if self.weights.dtype == np.float16 else self.weights.dtype)
+        # Weighted sums of the whole batch computed by Conv2D.forward_batch
+        self.batch_weighted_sum = np.ndarray(
+            (self.batch_size, output_shape[0] * output_shape[1], self.number_of_filters), self.x_col.dtype)
 
     def generate_weights(self, layers: list[Layer], current_layer_index: int, weight_data_type: np.float_, bias_data_type: np.float_) -> None:
-        """Function used for weights generation for Conv2D layer with 4d weights. The shape of the weights is (kernel_size[0], kernel_size[1], input_shape[-1], number_of_filters)
+        """Function used for weights generation for Conv2D layer with 4d weights. The shape of the weights is (number_of_filters, input_shape[-1], kernel_size[0], kernel_size[1]),
+        so weights.reshape(number_of_filters, -1) is a contiguous view with the same row order as the im2col columns
 
         Args:
             layers (list): All layers in the model
@@ -170,21 +264,33 @@ class Conv2D(LayerWithParams):
             weight_data_type (np.float_): In what data type do you want to store the weights. Only use datatypes like np.float32 and np.float64
             bias_data_type (np.float_): In what data type do you want to store the biases. Only use datatypes like np.float32 and np.float64
         """
-        input_shape = layers[current_layer_index -
-                             1].output_shape(layers, current_layer_index-1) if self.input_shape is None else self.input_shape
+        input_shape = self.previous_output_shape(
+            layers, current_layer_index) if self.input_shape is None else self.input_shape
 
         weights_shape = (self.kernel_size[0], self.kernel_size[1],
                          input_shape[-1], self.number_of_filters)
 
+        # The initializers compute the fans from the (kernel_size[0], kernel_size[1], channels, filters) shape used by Keras,
+        # so we generate the weights in it and only then reshape them into the (filters, channels, kernel_size[0], kernel_size[1]) layout
         self.weights = self.weight_initialization(
-            weights_shape, weight_data_type)
+            weights_shape, weight_data_type).reshape(self.number_of_filters, input_shape[-1], *self.kernel_size)
 
         self.biases = self.bias_initialization(
             self.number_of_filters, bias_data_type)
 
+    def set_weights(self, weights: np.ndarray, biases: np.ndarray) -> None:
+        """Function used to set the weights and biases of the layer. Weights saved in the old (kernel_size[0], kernel_size[1], channels, filters) shape
+        are stored in the same memory order, so they are reshaped into (filters, channels, kernel_size[0], kernel_size[1])
+
+        Args:
+            weights (np.ndarray): Weights of the layer
+            biases (np.ndarray): Biases of the layer
+        """
+        super().set_weights(np.reshape(weights, (self.number_of_filters, -1, *self.kernel_size)), biases)
+
     def output_shape(self, layers: list[Layer], current_layer_index: int) -> tuple:
-        self.input_shape: tuple = layers[current_layer_index -
-                                         1].output_shape(layers, current_layer_index-1) if self.input_shape is None else self.input_shape
+        self.input_shape: tuple = self.previous_output_shape(
+            layers, current_layer_index) if self.input_shape is None else self.input_shape
         height = (self.input_shape[0] -
                   self.kernel_size[0]) // self.strides[0] + 1
         width = (self.input_shape[1] -
@@ -197,68 +303,181 @@ class Conv2D(LayerWithParams):
         formatted_output = f'(None, {", ".join(map(str, self.output_shape_value))})'
         return f"{self.name} (Conv2D){' ' * (28 - len(self.name) - 8)}{formatted_output}{' ' * (26-len(formatted_output))}{self.weights.size + self.biases.size}\n"
 
-    def im2col_indices(self, inputs_shape: tuple) -> tuple[int]:
-        height = (inputs_shape[0] - self.kernel_size[0]) // self.strides[0] + 1
-        width = (inputs_shape[1] - self.kernel_size[1]) // self.strides[1] + 1
-        channels = inputs_shape[-1]
+    def im2col(self, x: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Support function to perform im2col operation for input data in Conv2D feed forward\n
+        We use this as resarch proved it's faster to use im2col and then a simple matrix multiplication
+        then sliding the kernel over the data and applying the filters manually
 
-        i0 = np.repeat(np.arange(self.kernel_size[0]), self.kernel_size[1])
-        i0 = np.tile(i0, channels)
-        i1 = self.strides[0] * np.repeat(np.arange(height), width)
-        j0 = np.tile(
-            np.arange(self.kernel_size[1]), self.kernel_size[0] * channels)
-        j1 = self.strides[1] * np.tile(np.arange(width), height)
-        i = i0.reshape(-1, 1) + i1.reshape(1, -1)
-        j = j0.reshape(-1, 1) + j1.reshape(1, -1)
+        Args:
+            x (np.ndarray): Img we should perform the operation on. It should be 3d: height, width, channels
+            out (np.ndarray, optional): Preallocated array to store the columns in. Defaults to None.
 
-        k = np.repeat(np.arange(channels),
-                      self.kernel_size[0] * self.kernel_size[1]).reshape(-1, 1)
+        Returns:
+            np.ndarray: Columns calculated by the algorithm. Rows are ordered by channel, kernel row and kernel column
+            and columns by output row and output column
+        """
+        height = (x.shape[0] - self.kernel_size[0]) // self.strides[0] + 1
+        width = (x.shape[1] - self.kernel_size[1]) // self.strides[1] + 1
 
-        return (i, j, k)
+        if out is None:
+            out = np.empty((self.kernel_size[0] * self.kernel_size[1] * x.shape[-1], height * width), x.dtype)
 
-    def im2col(self, x: np.ndarray) -> np.ndarray:
-        """Support function to perform im2col operation for input data in Conv2D feed forward\n
-        We use this as resarch proved it's faster to use im2col and then a simple matrix multiplication
-        then sliding the kernel over the data and applying the filters manually
+        if _kernels.USE_NUMBA:
+            _kernels.im2col_2d(x, self.kernel_size[0], self.kernel_size[1],
+                               self.strides[0], self.strides[1], out)
+
+            return out
+
+        # Windows have the shape (height, width, channels, kernel_size[0], kernel_size[1])
+        windows = sliding_window_view(x, self.kernel_size, axis=(0, 1))[
+            ::self.strides[0], ::self.strides[1]]
+
+        # Copying through a reshaped view of out, so the transposed windows are written without a temporary array
+        out.reshape(x.shape[-1], *self.kernel_size, height, width)[...] = windows.transpose(2, 3, 4, 0, 1)
+
+        return out
+
+    def fuse_pool(self, pool: Layer) -> bool:
+        """Function used to fuse the MaxPool2D layer right after this layer into the inference feed forward. The activation is applied
+        after pooling, so it only works for activations that don't change the order of the values.
+        The layer itself isn't changed by it, NN.feed_forward() and NN.evaluate() call Conv2D.forward_into_pool() and skip the MaxPool2D layer
+
+        Args:
+            pool (Layer): MaxPool2D layer that comes after this layer
+
+        Returns:
+            bool: True if the layers were fused
+        """
+        if not isinstance(self.activation, (ReLU, LeakyReLU, Sigmoid, Tanh)):
+            return False
+
+        if isinstance(self.activation, LeakyReLU) and self.activation.alpha < 0:
+            return False
+
+        self.fused_pool = pool
+
+        return True
+
+    def _weights_col(self) -> tuple[np.ndarray, np.ndarray]:
+        """Support function that returns the weights as a (filters, kernel_size[0] * kernel_size[1] * channels) matrix and it's contiguous transpose
+        used by the Numba kernels. Both are in the dtype the feed forward is computed in. They are cached, so the transpose and the float16 upcast
+        aren't copied on every call. The cache is cleared in Conv2D.backpropagate and when the weights array is replaced, like in set_weights
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: weights_col and weights_col.T
+        """
+        if self._weights_cache is None or self._weights_cache[0] is not self.weights:
+            # With the (filters, channels, kernel_size[0], kernel_size[1]) layout this reshape is a view
+            weights_col = self.weights.reshape(self.number_of_filters, -1)
+            if weights_col.dtype == np.float16:
+                # Half precision weights are only used for storage, and Numba doesn't support float16
+                weights_col = weights_col.astype(np.float32)
+
+            self._weights_cache = (self.weights, weights_col,
+                                   np.ascontiguousarray(weights_col.T))
+
+        return self._weights_cache[1:]
+
+    def forward_into_pool(self, x: np.ndarray) -> np.ndarray:
+        """Inference feed forward of the Conv2D layer fused with the MaxPool2D layer after it. It returns the output of the MaxPool2D layer
+        and doesn't store the output of the Conv2D layer, as the activation is applied only to the pooled values
 
         Args:
             x (np.ndarray): Img we should perform the operation on. It should be 3d: height, width, channels
 
         Returns:
-            np.ndarray: Columns calculated by the algorithm
+            np.ndarray: Output of the MaxPool2D layer
         """
-        i, j, k = self.im2col_indices(x.shape)
-        return x[i, j, k]
+        # The same cast as in Conv2D.__call__, so the fused feed forward runs in the same precision
+        x = x.astype(np.float32 if self.weights.dtype ==
+                     np.float16 else self.weights.dtype, copy=False)
+
+        pool_size, pool_strides = self.fused_pool.pool_size, self.fused_pool.strides
+
+        height = (x.shape[0] - self.kernel_size[0]) // self.strides[0] + 1
+        width = (x.shape[1] - self.kernel_size[1]) // self.strides[1] + 1
+
+        weights_col, weights_col_t = self._weights_col()
+
+        if _kernels.USE_NUMBA:
+            pooled = np.empty(((height - pool_size[0]) // pool_strides[0] + 1, (width - pool_size[1]) // pool_strides[1] + 1,
+                               self.number_of_filters), np.result_type(x, weights_col))
+
+            _kernels.conv2d_maxpool_forward(x, weights_col_t, self.kernel_size[0], self.kernel_size[1], self.strides[0],
+                                            self.strides[1], pool_size[0], pool_size[1], pool_strides[0], pool_strides[1], pooled)
+        else:
+            weighted_sum = np.dot(self.im2col(x).T, weights_col.T).reshape(
+                height, width, self.number_of_filters)
+
+            pooled = sliding_window_view(weighted_sum, pool_size, axis=(0, 1))[
+                ::pool_strides[0], ::pool_strides[1]].max(axis=(-2, -1))
+
+        return self.activation.apply_activation(pooled)
 
     def __call__(self, x: np.ndarray, is_training: bool = False) -> np.ndarray:
         input_shape = x.shape
 
+        # Casting x to the dtype of the weights, so the matrix multiplication runs in a single BLAS precision.
+        # Half precision weights are only used for storage, so we compute in float32 for them
+        x = x.astype(np.float32 if self.weights.dtype ==
+                     np.float16 else self.weights.dtype, copy=False)
+
         if is_training:
             self.inputs[self.current_batch] = x
 
-        x_col = self.im2col(x)
-
         height = (input_shape[0] -
                   self.kernel_size[0]) // self.strides[0] + 1
         width = (input_shape[1] -
                  self.kernel_size[1]) // self.strides[1] + 1
 
-        self.weights_col = self.weights.reshape(self.number_of_filters, -1)
+        weights_col, weights_col_t = self._weights_col()
+
+        if _kernels.USE_NUMBA and not is_training:
+            # During inference the columns aren't needed for backpropagate, so we convolve x directly
+            weighted_sum = np.empty((height, width, self.number_of_filters),
+                                    np.result_type(x, weights_col))
 
-        weighted_sum = np.dot(self.weights_col, x_col)
+            if tuple(self.kernel_size) == (3, 3) and tuple(self.strides) == (1, 1):
+                _kernels.conv2d_3x3_forward(x, weights_col_t, weighted_sum)
+            else:
+                _kernels.conv2d_forward(x, weights_col_t, self.kernel_size[0],
+                                        self.kernel_size[1], self.strides[0], self.strides[1], weighted_sum)
+        else:
+            # During training the columns are written into the buffer backpropagate reads them from
+            x_col = self.im2col(
+                x, self.x_col[self.current_batch] if is_training else None)
 
-        weighted_sum = weighted_sum.reshape(
-            self.number_of_filters, height, width).transpose(1, 2, 0)
+            # Computing the transposed product gives us a contiguous (height, width, filters) output
+            # so the layers after Conv2D like Flatten don't have to copy it
+            weighted_sum = _kernels.matmul_blas(x_col.T, weights_col.T).reshape(
+                height, width, self.number_of_filters)
 
         output = self.activation.apply_activation(weighted_sum)
 
         if is_training:
             self.outputs[self.current_batch] = output
-            self.x_col[self.current_batch] = x_col
             self.current_batch += 1
 
         return output
 
+    def forward_batch(self, x: np.ndarray) -> np.ndarray:
+        # On a single thread the per sample feed forward is faster, as scipy's gemm beats the one Numba calls.
+        # Numba also needs scipy for the matrix multiplications in the kernel
+        if not (_kernels.USE_NUMBA and _kernels.SCIPY_AVAILABLE and _kernels.number_of_threads() > 1):
+            return super().forward_batch(x)
+
+        x = x.astype(self.x_col.dtype, copy=False)
+        self.inputs[:] = x
+
+        _, weights_col_t = self._weights_col()
+        weighted_sum = self.batch_weighted_sum
+
+        # The kernel also writes the columns of every sample into the buffer backpropagate reads them from
+        _kernels.conv2d_forward_batch(x, weights_col_t, self.kernel_size[0], self.kernel_size[1],
+                                      self.strides[0], self.strides[1], self.x_col, weighted_sum)
+
+        return self.activation.apply_activation_into(weighted_sum.reshape(self.outputs.shape), self.outputs)
+
     def backpropagate(self, gradient: np.ndarray, optimizer: list[Optimizer]) -> np.ndarray:
         """Backpropagate algorithm used for Conv2D layer.
 
@@ -272,7 +491,7 @@ class Conv2D(LayerWithParams):
         """
         inputs = np.average(self.inputs, axis=0)
         outputs = np.average(self.outputs, axis=0)
-        x_col = np.average(np.array(self.x_col), axis=0)
+        x_col = np.average(self.x_col, axis=0)
 
         if self.regulizer:
             gradient = self.regulizer.update_gradient(
@@ -280,12 +499,16 @@ class Conv2D(LayerWithParams):
 
         delta = (gradient * self.activation.compute_derivative(outputs))
 
-        weights_gradients = (delta.reshape(
-            self.number_of_filters, -1) @ x_col.T).reshape(self.weights.shape)
+        # delta has the shape (height, width, filters), so we transpose it into (filters, height * width) to match the columns of x_col.
+        # A single matrix multiplication then gives us the gradients of all filters in the layout of weights_col
+        weights_gradients = _kernels.matmul_blas(delta.reshape(-1, self.number_of_filters).T, x_col.T).reshape(
+            self.weights.shape)
 
         if self.trainable:
             self.weights, self.biases = optimizer[1].apply_gradients(
                 weights_gradients, np.average(delta, (0, 1)), self.weights, self.biases)
+            # The optimizers update the weights in place, so the cache can't detect the change by itself
+            self._weights_cache = None
 
         self.current_batch = 0
 
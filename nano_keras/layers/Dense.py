@@ -1,5 +1,6 @@
 from nano_keras.activations import Activation
 from nano_keras.initializers import Initializer
+from nano_keras import _kernels
 from nano_keras.layers import Layer, LayerWithParams
 import numpy as np
 from nano_keras.optimizers import Optimizer
@@ -26,12 +27,175 @@ class Dense(LayerWithParams):
         super().__init__(units, activation, weight_initialization,
                          bias_initalization, regulizer, trainable, input_shape, name)
 
+        # Inference buffers allocated by Dense.bind_buffers
+        self._weighted_sum: np.ndarray = None
+        self._out: np.ndarray = None
+        # Training buffer allocated by Dense.set_batch_size
+        self.batch_weighted_sum: np.ndarray = None
+
     def output_shape(self, layers: list[Layer], current_layer_index: int) -> tuple:
         return self.units
 
+    def set_batch_size(self, batch_size: int, layers: list, index: int) -> None:
+        super().set_batch_size(batch_size, layers, index)
+
+        # Weighted sums of the batch. Training writes into it instead of allocating a new array for every sample or batch
+        self.batch_weighted_sum = np.ndarray(
+            (batch_size, self.units), self._compute_dtype())
+
+    def bind_buffers(self, layers: list[Layer], current_layer_index: int) -> None:
+        dtype = self._compute_dtype()
+
+        self._weighted_sum = np.empty(self.units, dtype)
+        self._out = np.empty(self.units, dtype)
+
+    def _compute_dtype(self) -> np.dtype:
+        """Support function that returns the dtype the feed forward is computed in. int8, float16 and bfloat16 weights are only used for storage,
+        as NumPy doesn't compute in them on most CPUs, so they are computed in float32
+
+        Returns:
+            np.dtype: float32 or float64
+        """
+        return self.weights.dtype if self.weights.dtype in (np.float32, np.float64) else np.dtype(np.float32)
+
+    def quantize(self, dtype: str = "int8") -> None:
+        """Function used to store the weights of the layer in a smaller data type for inference.\n
+        With int8 the weights are stored with a float32 scale for every output neuron, which reduces their size by 4 times compared to float32.
+        With bfloat16 they're just rounded, which halves their size and keeps the range of float32. bfloat16 requires the ml_dtypes package.
+        In both cases the layer can only be used for inference after that. The biases are kept in their original data type
+
+        Args:
+            dtype (str, optional): Data type to store the weights in. Your options are: int8, bfloat16. Defaults to "int8".
+
+        Raises:
+            ValueError: If the data type isn't supported
+            ImportError: If bfloat16 is used without ml_dtypes installed
+        """
+        if dtype == "bfloat16":
+            try:
+                import ml_dtypes
+            except ImportError:
+                raise ImportError(
+                    "bfloat16 weights require ml_dtypes to be installed. You can install it using: pip install ml_dtypes")
+
+            self.weights = self.weights.astype(ml_dtypes.bfloat16)
+            return
+
+        if dtype != "int8":
+            raise ValueError(
+                f"Data type {dtype} isn't supported. Possible data types are: int8, bfloat16")
+
+        scale = np.abs(self.weights).max(axis=0) / 127.0
+        # Neurons with only zero weights would have a scale of 0
+        scale[scale == 0] = 1
+
+        self.weights = np.round(self.weights / scale).astype(np.int8)
+        self.weights_scale: np.ndarray = scale.astype(np.float32)
+
+    def dequantize(self) -> None:
+        """Function used to convert the weights created by Dense.quantize() back to float32, so the layer can be trained again
+        """
+        if self.weights.dtype == np.int8:
+            self.weights = self.weights.astype(np.float32) * self.weights_scale
+        else:
+            self.weights = self.weights.astype(np.float32)
+
     def __repr__(self) -> str:
         return f"{self.name} (Dense){' ' * (28 - len(self.name) - 7)}{(None, self.units)}{' ' * (26 - len(f'(None, {self.units})'))}{self.weights.size + self.biases.size}\n"
 
+    def __call__(self, x: np.ndarray, is_training: bool = False) -> np.ndarray:
+        """Feed forward function for the Dense layer\n
+        Note that after NN.compile() the inference output of a single sample is the buffer from Dense.bind_buffers, which is overwritten by the next call.
+        Copy it if you call the layer directly and want to keep the output. NN.feed_forward() and NN.evaluate() already do that
+
+        Args:
+            x (np.ndarray): X dataset
+            is_training (bool): Determines whether the layer should behave like in the training loop or no. Defaults to False.
+
+        Returns:
+            np.ndarray: Output of the layer
+        """
+        # Casting x to the dtype the dot product is computed in, so a float64 x doesn't silently upcast it
+        x = x.astype(self._compute_dtype(), copy=False)
+
+        # During inference we write into the buffers from Dense.bind_buffers instead of allocating new arrays
+        use_buffers = not is_training and self._weighted_sum is not None and x.ndim == 1 and x.dtype == self._weighted_sum.dtype
+        out = self._weighted_sum if use_buffers else None
+
+        if is_training and self.batch_weighted_sum is not None and x.ndim == 1 and x.dtype == self.batch_weighted_sum.dtype:
+            out = self.batch_weighted_sum[self.current_batch]
+
+        if self.weights.dtype != x.dtype and _kernels.USE_NUMBA and x.ndim == 1 and self.weights.dtype != np.float16:
+            # The kernels convert the int8 and bfloat16 weights while they read them, so they aren't copied to float32 on every call
+            weighted_sum = out if out is not None else np.empty(
+                self.units, np.float32)
+            if self.weights.dtype == np.int8:
+                _kernels.dense_int8_forward(
+                    x, self.weights, self.weights_scale, weighted_sum)
+            else:
+                _kernels.dense_bfloat16_forward(
+                    x, self.weights.view(np.uint16), weighted_sum)
+        elif self.weights.dtype == np.int8:
+            # Quantized weights are converted to float32 for the dot product and the scale of each neuron is applied on the output
+            weighted_sum = np.dot(
+                x, self.weights.astype(np.float32), out=out)
+            weighted_sum *= self.weights_scale
+        elif self.weights.dtype != x.dtype:
+            # Half precision weights are only used for storage, as NumPy doesn't compute in float16 or bfloat16 on most CPUs
+            weighted_sum = np.dot(
+                x, self.weights.astype(np.float32), out=out)
+        else:
+            weighted_sum = np.dot(x, self.weights, out=out)
+
+        np.add(weighted_sum, self.biases, out=weighted_sum)
+
+        if is_training:
+            self.inputs[self.current_batch] = x
+            # The activation writes straight into the stored outputs, so we don't have to copy them
+            output = self.activation.apply_activation_into(
+                weighted_sum, self.outputs[self.current_batch])
+            self.current_batch += 1
+
+            return output
+
+        if use_buffers:
+            return self.activation.apply_activation_into(weighted_sum, self._out)
+
+        return self.activation.apply_activation(weighted_sum)
+
+    def forward_batch(self, x: np.ndarray) -> np.ndarray:
+        weights = self.weights.astype(self._compute_dtype(), copy=False)
+        x = x.astype(weights.dtype, copy=False)
+
+        self.inputs[:] = x
+
+        out = self.batch_weighted_sum if self.batch_weighted_sum is not None and \
+            self.batch_weighted_sum.shape[0] == len(x) and self.batch_weighted_sum.dtype == x.dtype else None
+
+        weighted_sum = np.dot(x, weights, out=out)
+        if self.weights.dtype == np.int8:
+            weighted_sum *= self.weights_scale
+        weighted_sum += self.biases
+
+        return self._activate_batch(weighted_sum, self.outputs)
+
+    def predict_batch(self, x: np.ndarray) -> np.ndarray:
+        if x.ndim != 2:
+            return super().predict_batch(x)
+
+        x = x.astype(self._compute_dtype(), copy=False)
+
+        # Casting the stored weights once for the whole batch is cheap compared to the matrix multiplication
+        weights = self.weights if self.weights.dtype == x.dtype else self.weights.astype(
+            np.float32)
+
+        weighted_sum = np.dot(x, weights)
+        if self.weights.dtype == np.int8:
+            weighted_sum *= self.weights_scale
+        weighted_sum += self.biases
+
+        return self._activate_batch(weighted_sum, np.empty_like(weighted_sum))
+
     def backpropagate(self, gradient: np.ndarray, optimizer: list[Optimizer]) -> np.ndarray:
         """Backpropagation algorithm for the dense layer
 
@@ -43,6 +207,10 @@ class Dense(LayerWithParams):
         Returns:
             np.ndarray: Output gradient of the layer
         """
+        if self.weights.dtype == np.int8 or self.weights.dtype.name == "bfloat16":
+            raise ValueError(
+                f"Layer {self.name} has quantized weights. Call Dense.dequantize() before training it")
+
         inputs = np.average(self.inputs, axis=0)
         outputs = np.average(self.outputs, axis=0)
 
@@ -28,6 +28,17 @@ class Dropout(LayerWithParams):
         super().__init__(units, activation, weight_initialization,
                          bias_initialization, regulizer, trainable, input_shape, name)
         self.dropout_rate: float = dropout_rate
+        # Inverted dropout scale. We multiply by it instead of dividing by (1 - dropout_rate) on every call
+        self.scale: float = 1 / (1 - dropout_rate)
+        # Training buffer allocated by Dropout.set_batch_size
+        self.batch_weighted_sum: np.ndarray = None
+
+    def set_batch_size(self, batch_size: int, layers: list, index: int) -> None:
+        super().set_batch_size(batch_size, layers, index)
+
+        # Weighted sums of the batch computed by Dropout.forward_batch, so it doesn't allocate a new array for every batch
+        self.batch_weighted_sum = np.ndarray(
+            (batch_size, self.units), np.result_type(self.inputs, self.weights))
 
     def output_shape(self, layers: list[Layer], current_layer_index: int) -> tuple:
         return self.units
@@ -52,10 +63,9 @@ class Dropout(LayerWithParams):
         weighted_sum = np.dot(x, self.weights) + self.biases
 
         if is_training:
-            weighted_sum *= (np.random.rand(*weighted_sum.shape)
-                             >= self.dropout_rate).astype(np.float64)
+            weighted_sum *= np.random.rand(*weighted_sum.shape) >= self.dropout_rate
 
-            weighted_sum /= (1 - self.dropout_rate)
+            weighted_sum *= self.scale
 
             self.outputs[self.current_batch] = self.activation.apply_activation(
                 weighted_sum)
@@ -66,6 +76,32 @@ class Dropout(LayerWithParams):
 
         return self.activation.apply_activation(weighted_sum)
 
+    def forward_batch(self, x: np.ndarray) -> np.ndarray:
+        self.is_training = True
+        self.inputs[:] = x
+
+        out = self.batch_weighted_sum if self.batch_weighted_sum is not None and self.batch_weighted_sum.shape[0] == len(x) \
+            and self.batch_weighted_sum.dtype == np.result_type(x, self.weights) else None
+
+        weighted_sum = np.dot(x, self.weights, out=out)
+        weighted_sum += self.biases
+
+        # Drawing the mask of the whole batch at once gives the same random numbers as drawing it for every sample
+        weighted_sum *= np.random.rand(*weighted_sum.shape) >= self.dropout_rate
+        weighted_sum *= self.scale
+
+        return self._activate_batch(weighted_sum, self.outputs)
+
+    def predict_batch(self, x: np.ndarray) -> np.ndarray:
+        if x.ndim != 2:
+            return super().predict_batch(x)
+
+        # The mask is only applied during training
+        weighted_sum = np.dot(x, self.weights)
+        weighted_sum += self.biases
+
+        return self._activate_batch(weighted_sum, np.empty_like(weighted_sum))
+
     def backpropagate(self, gradient: np.ndarray, optimizer: list[Optimizer]) -> np.ndarray:
         """Backpropagation algorithm for the dropout layer
 
@@ -87,7 +123,7 @@ class Dropout(LayerWithParams):
         delta = gradient * self.activation.compute_derivative(outputs)
 
         if self.is_training:
-            delta /= (1 - self.dropout_rate)
+            delta *= self.scale
 
         weights_gradients = np.outer(inputs, delta)
 
@@ -25,8 +25,8 @@ class Embedding(LayerWithParams):
         self.output_dim: int = output_dim
         self.input_length: int = input_length
 
-        self.embedding_initalizer: Initializer = embedding_initalizer if type(
-            embedding_initalizer) == Initializer else INITIALIZERS[embedding_initalizer]
+        self.embedding_initalizer: Initializer = embedding_initalizer if isinstance(
+            embedding_initalizer, Initializer) else INITIALIZERS[embedding_initalizer]
 
         self.regulizer: Regularizer = regulizer
         self.trainable: bool = trainable
@@ -45,17 +45,17 @@ class Embedding(LayerWithParams):
         if self.input_length:
             input_shape = self.input_length
         else:
-            input_shape = layers[index - 1].output_shape(layers, index-1)
+            input_shape = self.previous_output_shape(layers, index)
 
-        self.inputs = np.ndarray((self.batch_size, *input_shape)) if type(
-            input_shape) == tuple else np.ndarray((self.batch_size, input_shape))
+        self.inputs = np.ndarray((self.batch_size, *input_shape)) if isinstance(
+            input_shape, tuple) else np.ndarray((self.batch_size, input_shape))
 
     def output_shape(self, layers: list, current_layer_index: int) -> tuple:
         if self.input_length:
             input_shape = self.input_length
         else:
-            input_shape = layers[current_layer_index -
-                                 1].output_shape(layers, current_layer_index-1)
+            input_shape = self.previous_output_shape(
+                layers, current_layer_index)
 
         self.output_shape_value = (input_shape, self.output_dim)
 
@@ -63,7 +63,7 @@ class Embedding(LayerWithParams):
 
     def __repr__(self) -> str:
         formatted_output = f"(None, {self.output_shape_value})"
-        if type(self.output_shape_value) == tuple:
+        if isinstance(self.output_shape_value, tuple):
             formatted_output = f'(None, {", ".join(map(str, self.output_shape_value))})'
 
         return f"{self.name} (Embedding){' ' * (28 - len(self.name) - 11)}{formatted_output}{' ' * (26 - len(formatted_output))}{self.weights.size}\n"
@@ -72,8 +72,8 @@ class Embedding(LayerWithParams):
         if self.input_length:
             input_shape = self.input_length
         else:
-            input_shape = layers[current_layer_index -
-                                 1].output_shape(layers, current_layer_index-1)
+            input_shape = self.previous_output_shape(
+                layers, current_layer_index)
 
         self.weights = self.embedding_initalizer(
             (self.input_dim, self.output_dim), weight_data_type)
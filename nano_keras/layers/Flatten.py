@@ -18,11 +18,9 @@ class Flatten(Layer):
         self.name: str = name
 
     def output_shape(self, layers: list[Layer], current_layer_index: int) -> tuple:
-        input_shape = layers[current_layer_index -
-                             1].output_shape(layers, current_layer_index-1) if self.input_shape is None else self.input_shape
+        input_shape = self.previous_output_shape(
+            layers, current_layer_index) if self.input_shape is None else self.input_shape
         self.output_shape_value: int = np.prod(np.array(input_shape))
-        self.next_layer_shape: tuple = layers[current_layer_index +
-                                              1].output_shape(layers, current_layer_index+1)
         return self.output_shape_value
 
     def __repr__(self) -> str:
@@ -30,7 +28,15 @@ class Flatten(Layer):
 
     def __call__(self, x: np.ndarray, is_training: bool = False) -> np.ndarray:
         self.original_shape: tuple = x.shape
-        return np.ravel(x)
+        # Reshape returns a view if x is contiguous, so we only copy the data when it's necessary
+        return x.reshape(-1)
+
+    def forward_batch(self, x: np.ndarray) -> np.ndarray:
+        self.original_shape: tuple = x.shape[1:]
+        return x.reshape(len(x), -1)
+
+    def predict_batch(self, x: np.ndarray) -> np.ndarray:
+        return x.reshape(len(x), -1)
 
     def backpropagate(self, gradient: np.ndarray, optimizer: list[Optimizer]) -> np.ndarray:
         """Backpropagate algorithm for the flatten layer. We unflatten the gradient in here
@@ -43,10 +49,4 @@ class Flatten(Layer):
         Returns:
             np.ndarray: Output gradient
         """
-        try:
-            return gradient.reshape(self.next_layer_shape, *self.original_shape)
-        except ValueError:
-            try:
-                return gradient.reshape(*self.original_shape)
-            except ValueError:
-                return gradient
+        return gradient.reshape(self.original_shape)
@@ -27,17 +27,17 @@ class GRU(LayerWithParams):
             name (str, optional): Name of the layer. Helpful for debugging. Defaults to "Layer".
         """
         self.units: int = units
-        self.activation: Activation = activation if type(
-            activation) == Activation else ACTIVATIONS[activation]
-        self.recurrent_activation: Activation = recurrent_actvation if type(
-            recurrent_actvation) == Activation else ACTIVATIONS[recurrent_actvation]
-
-        self.weight_initialization: Initializer = weight_initialization if type(
-            weight_initialization) == Initializer else INITIALIZERS[weight_initialization]
-        self.recurrent_weight_initialization: Initializer = recurrent_weight_initialization if type(
-            recurrent_weight_initialization) == Initializer else INITIALIZERS[recurrent_weight_initialization]
-        self.bias_initialization: Initializer = bias_initalization if type(
-            bias_initalization) == Initializer else INITIALIZERS[bias_initalization]
+        self.activation: Activation = activation if isinstance(
+            activation, Activation) else ACTIVATIONS[activation]
+        self.recurrent_activation: Activation = recurrent_actvation if isinstance(
+            recurrent_actvation, Activation) else ACTIVATIONS[recurrent_actvation]
+
+        self.weight_initialization: Initializer = weight_initialization if isinstance(
+            weight_initialization, Initializer) else INITIALIZERS[weight_initialization]
+        self.recurrent_weight_initialization: Initializer = recurrent_weight_initialization if isinstance(
+            recurrent_weight_initialization, Initializer) else INITIALIZERS[recurrent_weight_initialization]
+        self.bias_initialization: Initializer = bias_initalization if isinstance(
+            bias_initalization, Initializer) else INITIALIZERS[bias_initalization]
 
         self.return_sequences: bool = return_sequences
         self.regulizer: Regularizer = regulizer
@@ -48,8 +48,8 @@ class GRU(LayerWithParams):
         self.current_batch: int = 0
 
     def output_shape(self, layers: list[Layer], current_layer_index: int) -> tuple:
-        input_shape = layers[current_layer_index -
-                             1].output_shape(layers, current_layer_index-1) if self.input_shape is None else self.input_shape
+        input_shape = self.previous_output_shape(
+            layers, current_layer_index) if self.input_shape is None else self.input_shape
 
         self.output_shape_value = (
             input_shape[0], self.units) if self.return_sequences else self.units
@@ -59,8 +59,8 @@ class GRU(LayerWithParams):
     def set_batch_size(self, batch_size: int, layers: list, index: int) -> None:
         self.batch_size = batch_size
 
-        input_shape = layers[index-1].output_shape(
-            layers, index-1) if self.input_shape is None else self.input_shape
+        input_shape = self.previous_output_shape(
+            layers, index) if self.input_shape is None else self.input_shape
         input_shape = tuple(input_shape)
 
         self.inputs = np.zeros((batch_size, *input_shape))
@@ -74,14 +74,14 @@ class GRU(LayerWithParams):
 
     def __repr__(self) -> str:
         formatted_output = f"(None, {self.output_shape_value})"
-        if type(self.output_shape_value) == tuple:
+        if isinstance(self.output_shape_value, tuple):
             formatted_output = f'(None, {", ".join(map(str, self.output_shape_value))})'
 
         return f"{self.name} (GRU){' ' * (28 - len(self.name) - 5)}{formatted_output}{' ' * (26 - len(formatted_output))}{self.input_weights.size + self.recurrent_weights.size + self.biases.size}\n"
 
     def generate_weights(self, layers: list[Layer], current_layer_index: int, weight_data_type: np.float_, bias_data_type: np.float_) -> None:
-        input_shape = layers[current_layer_index -
-                             1].output_shape(layers, current_layer_index-1) if self.input_shape is None else self.input_shape
+        input_shape = self.previous_output_shape(
+            layers, current_layer_index) if self.input_shape is None else self.input_shape
 
         input_weights_shape = (3, input_shape[1], self.units)
         recurrent_weights_shape = (3, self.units, self.units)
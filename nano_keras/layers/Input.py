@@ -16,7 +16,7 @@ class Input(Layer):
         self.input_shape: tuple = input_shape
         self.name: str = name
         self.biases: np.ndarray = np.random.randn(
-            *input_shape) if type(input_shape) == tuple else np.random.randn(input_shape)
+            *input_shape) if isinstance(input_shape, tuple) else np.random.randn(input_shape)
 
     def output_shape(self, layers: list[Layer], current_layer_index: int) -> tuple:
         return self.input_shape
@@ -30,3 +30,9 @@ class Input(Layer):
 
     def __call__(self, x: np.ndarray, is_training: bool = False) -> np.ndarray:
         return x
+
+    def forward_batch(self, x: np.ndarray) -> np.ndarray:
+        return x
+
+    def predict_batch(self, x: np.ndarray) -> np.ndarray:
+        return x
@@ -29,17 +29,17 @@ class LSTM(LayerWithParams):
             name (str, optional): Name of the layer. Helpful for debugging. Defaults to "Layer".
         """
         self.units: int = units
-        self.activation: Activation = activation if type(
-            activation) == Activation else ACTIVATIONS[activation]
-        self.recurrent_activation: Activation = recurrent_activation if type(
-            recurrent_activation) == Activation else ACTIVATIONS[recurrent_activation]
-
-        self.weight_initialization: Initializer = weight_initalization if type(
-            weight_initalization) == Initializer else INITIALIZERS[weight_initalization]
-        self.recurrent_weight_initalization: Initializer = recurrent_weight_initalization if type(
-            recurrent_weight_initalization) == Initializer else INITIALIZERS[recurrent_weight_initalization]
-        self.bias_initialization: Initializer = bias_initalization if type(
-            bias_initalization) == Initializer else INITIALIZERS[bias_initalization]
+        self.activation: Activation = activation if isinstance(
+            activation, Activation) else ACTIVATIONS[activation]
+        self.recurrent_activation: Activation = recurrent_activation if isinstance(
+            recurrent_activation, Activation) else ACTIVATIONS[recurrent_activation]
+
+        self.weight_initialization: Initializer = weight_initalization if isinstance(
+            weight_initalization, Initializer) else INITIALIZERS[weight_initalization]
+        self.recurrent_weight_initalization: Initializer = recurrent_weight_initalization if isinstance(
+            recurrent_weight_initalization, Initializer) else INITIALIZERS[recurrent_weight_initalization]
+        self.bias_initialization: Initializer = bias_initalization if isinstance(
+            bias_initalization, Initializer) else INITIALIZERS[bias_initalization]
 
         self.return_sequences: bool = return_sequences
         self.regulizer: Regularizer = regulizer
@@ -50,8 +50,7 @@ class LSTM(LayerWithParams):
         self.current_batch = 0
 
     def output_shape(self, layers: list[Layer], current_layer_index: int) -> tuple:
-        input_shape = layers[current_layer_index -
-                             1].output_shape(layers, current_layer_index-1)
+        input_shape = self.previous_output_shape(layers, current_layer_index)
         self.output_shape_value = (
             input_shape[0], self.units) if self.return_sequences else self.units
 
@@ -59,14 +58,14 @@ class LSTM(LayerWithParams):
 
     def __repr__(self) -> str:
         formatted_output = f"(None, {self.output_shape_value})"
-        if type(self.output_shape_value) == tuple:
+        if isinstance(self.output_shape_value, tuple):
             formatted_output = f'(None, {", ".join(map(str, self.output_shape_value))})'
 
         return f"{self.name} (LSTM){' ' * (28 - len(self.name) - 6)}{formatted_output}{' ' * (26 - len(formatted_output))}{self.input_weights.size + self.recurrent_weights.size + self.biases.size}\n"
 
     def set_batch_size(self, batch_size: int, layers: list, index: int) -> None:
         self.batch_size = batch_size
-        input_shape = layers[index-1].output_shape(layers, index-1)
+        input_shape = self.previous_output_shape(layers, index)
         input_shape = tuple(input_shape)
 
         self.hidden_state = np.zeros(
@@ -101,8 +100,7 @@ class LSTM(LayerWithParams):
         self.biases = biases
 
     def generate_weights(self, layers: list[Layer], current_layer_index: int, weight_data_type: np.float_, bias_data_type: np.float_) -> None:
-        input_shape = layers[current_layer_index -
-                             1].output_shape(layers, current_layer_index-1)
+        input_shape = self.previous_output_shape(layers, current_layer_index)
 
         input_weights_shape = (4, input_shape[1], self.units)
         recurrent_weights_shape = (4, self.units, self.units)
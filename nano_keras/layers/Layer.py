@@ -1,5 +1,5 @@
 import numpy as np
-from nano_keras.activations import Activation, ACTIVATIONS
+from nano_keras.activations import Activation, Softmax, ACTIVATIONS
 from nano_keras.regulizers import Regularizer
 from nano_keras.optimizers import Optimizer
 from nano_keras.initializers import Initializer, INITIALIZERS
@@ -25,13 +25,13 @@ class Layer:
         """
         self.units: int = units
 
-        self.weight_initialization: Initializer = INITIALIZERS[weight_initialization] if type(
-            weight_initialization) == str else weight_initialization
-        self.bias_initialization: Initializer = INITIALIZERS[bias_initialization] if type(
-            bias_initialization) == str else bias_initialization
+        self.weight_initialization: Initializer = INITIALIZERS[weight_initialization] if isinstance(
+            weight_initialization, str) else weight_initialization
+        self.bias_initialization: Initializer = INITIALIZERS[bias_initialization] if isinstance(
+            bias_initialization, str) else bias_initialization
 
-        self.activation: Activation = ACTIVATIONS[activation] if type(
-            activation) == str else activation
+        self.activation: Activation = ACTIVATIONS[activation] if isinstance(
+            activation, str) else activation
         self.regulizer: Regularizer = regulizer
         self.trainable: bool = trainable
         self.input_shape: tuple = input_shape
@@ -51,8 +51,8 @@ class Layer:
         """
         self.batch_size = batch_size
 
-        input_shape = layers[index-1].output_shape(
-            layers, index-1) if self.input_shape is None else self.input_shape
+        input_shape = self.previous_output_shape(
+            layers, index) if self.input_shape is None else self.input_shape
 
         output_shape = self.output_shape(layers, index)
 
@@ -71,8 +71,8 @@ class Layer:
             weight_data_type (np.float_): In what data type do you want to store the weights. Only use datatypes like np.float32 and np.float64
             bias_data_type (np.float_): In what data type do you want to store the biases. Only use datatypes like np.float32 and np.float64
         """
-        previous_units = layers[current_layer_index -
-                                1].output_shape(layers, current_layer_index-1) if self.input_shape is None else self.input_shape
+        previous_units = self.previous_output_shape(
+            layers, current_layer_index) if self.input_shape is None else self.input_shape
 
         if self.input_shape:
             # I've observed this gives us better results
@@ -86,6 +86,17 @@ class Layer:
 
         self.biases = self.bias_initialization(self.units, bias_data_type)
 
+    def bind_buffers(self, layers: list, current_layer_index: int) -> None:
+        """Function used to preallocate the buffers the layer writes it's inference feed forward into, so they aren't allocated on every call.
+        It's called in NN.compile() after the weights are generated. Layers without buffers don't have to implement it.
+        As the inference feed forward then returns the same array on every call, the callers have to copy the output if they want to keep it
+
+        Args:
+            layers (list): All layers in the model
+            current_layer_index (int): Index of the current layer
+        """
+        return
+
     def get_weights(self) -> list[np.ndarray]:
         """Function used to get the weights of the layer
 
@@ -122,6 +133,27 @@ class Layer:
         """
         return
 
+    def previous_output_shape(self, layers: list, current_layer_index: int) -> tuple:
+        """Function used to get the output shape of the previous layer. The shape is cached on the previous layer, so that getting
+        the shapes of all the layers doesn't recurse through the whole model every time. NN.compile() clears the cache
+
+        Args:
+            layers (list): All layers in the model
+            current_layer_index (int): Index of the current layer
+
+        Returns:
+            tuple: Output shape of the previous layer
+        """
+        previous_layer = layers[current_layer_index-1]
+        key = (id(layers), current_layer_index-1)
+
+        cache = getattr(previous_layer, "_output_shape_cache", None)
+        if cache is None or cache[0] != key:
+            previous_layer._output_shape_cache = (
+                key, previous_layer.output_shape(layers, current_layer_index-1))
+
+        return previous_layer._output_shape_cache[1]
+
     def __repr__(self) -> str:
         """Function to print out layer information
 
@@ -152,6 +184,50 @@ class Layer:
 
         return output
 
+    def forward_batch(self, x: np.ndarray) -> np.ndarray:
+        """Training feed forward for a whole batch used in NN.backpropagate(). Layers that can compute the batch at once,
+        like Dense, override it, so a single matrix multiplication replaces one vector-matrix product for every sample.
+        This implementation just calls the layer on every sample
+
+        Args:
+            x (np.ndarray): Batch of inputs in the shape of (batch_size, *input_shape)
+
+        Returns:
+            np.ndarray: Outputs of the layer in the shape of (batch_size, *output_shape)
+        """
+        return np.stack([self(sample, True) for sample in x])
+
+    def predict_batch(self, x: np.ndarray) -> np.ndarray:
+        """Inference feed forward for a whole batch used in NN.evaluate(). It doesn't store anything in the training buffers.
+        Layers that can compute the batch at once override it, and this implementation just calls the layer on every sample
+
+        Args:
+            x (np.ndarray): Batch of inputs in the shape of (batch_size, *input_shape)
+
+        Returns:
+            np.ndarray: Outputs of the layer in the shape of (batch_size, *output_shape)
+        """
+        # Layers can return their inference buffers, which are overwritten by the next sample, so every output has to be copied
+        return np.stack([self(sample, False).copy() for sample in x])
+
+    def _activate_batch(self, weighted_sum: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """Support function used in forward_batch() to apply the activation function on the weighted sums of the whole batch
+
+        Args:
+            weighted_sum (np.ndarray): Weighted sums of the batch in the shape of (batch_size, units)
+            out (np.ndarray): Array to store the outputs in
+
+        Returns:
+            np.ndarray: Outputs of the batch
+        """
+        if isinstance(self.activation, Softmax):
+            # Softmax normalizes over the whole array, so it has to be applied on every sample separately
+            for sample, sample_out in zip(weighted_sum, out):
+                self.activation.apply_activation_into(sample, sample_out)
+            return out
+
+        return self.activation.apply_activation_into(weighted_sum, out)
+
     def backpropagate(self, gradient: np.ndarray, optimizer: Optimizer | list[Optimizer]) -> np.ndarray:
         """Backpropagation algorithm base implementation for all the layers that don't have any parameters to update
 
@@ -28,10 +28,10 @@ class MultiHeadAttention(LayerWithParams):
         self.key_dim: int = key_dim
         self.value_dim: int = value_dim if value_dim else key_dim
 
-        self.weight_initialization: Initializer = INITIALIZERS[weight_initialization] if type(
-            weight_initialization) == str else weight_initialization
-        self.bias_initialization: Initializer = INITIALIZERS[bias_initialization] if type(
-            bias_initialization) == str else bias_initialization
+        self.weight_initialization: Initializer = INITIALIZERS[weight_initialization] if isinstance(
+            weight_initialization, str) else weight_initialization
+        self.bias_initialization: Initializer = INITIALIZERS[bias_initialization] if isinstance(
+            bias_initialization, str) else bias_initialization
 
         self.regulizer: Regularizer = regulizer
         self.trainable: bool = trainable
@@ -39,8 +39,8 @@ class MultiHeadAttention(LayerWithParams):
         self.name: str = name
 
     def output_shape(self, layers: list[Layer], current_layer_index: int) -> tuple:
-        self.output_shape_value = tuple(layers[current_layer_index -
-                                               1].output_shape(layers, current_layer_index-1))
+        self.output_shape_value = tuple(self.previous_output_shape(
+            layers, current_layer_index))
 
         return self.output_shape_value
 
@@ -48,14 +48,14 @@ class MultiHeadAttention(LayerWithParams):
         params_number = self.get_number_of_params()
 
         formatted_output = f"(None, {self.output_shape_value})"
-        if type(self.output_shape_value) == tuple:
+        if isinstance(self.output_shape_value, tuple):
             formatted_output = f'(None, {", ".join(map(str, self.output_shape_value))})'
 
         return f"{self.name} (MHA){' ' * (28 - len(self.name) - 5)}{formatted_output}{' ' * (26 - len(formatted_output))}{params_number}\n"
 
     def generate_weights(self, layers: list[Layer], current_layer_index: int, weight_data_type: np.float_, bias_data_type: np.float_) -> None:
-        input_shape = tuple(layers[current_layer_index -
-                                   1].output_shape(layers, current_layer_index-1)) if self.input_shape is None else self.input_shape
+        input_shape = tuple(self.previous_output_shape(
+            layers, current_layer_index)) if self.input_shape is None else self.input_shape
 
         self.query_weights = np.random.randn(
             input_shape[-1], self.num_heads, self.key_dim).astype(weight_data_type)
@@ -77,8 +77,8 @@ class MultiHeadAttention(LayerWithParams):
         self.output_biases = np.random.randn(
             input_shape[-1]).astype(bias_data_type)
 
-        self.output_shape_value = tuple(layers[current_layer_index -
-                                               1].output_shape(layers, current_layer_index-1))
+        self.output_shape_value = tuple(self.previous_output_shape(
+            layers, current_layer_index))
 
     def get_number_of_params(self) -> int:
         params_number = self.query_weights.size + self.query_biases.size + \
@@ -1,6 +1,6 @@
 import numpy as np
-from numpy.lib.stride_tricks import as_strided
-import math
+from numpy.lib.stride_tricks import sliding_window_view
+from nano_keras import _kernels
 from nano_keras.layers import Layer
 from nano_keras.optimizers import Optimizer
 
@@ -27,19 +27,23 @@ class PoolingLayey1D(Layer):
     def set_batch_size(self, batch_size: int, layers: list, index: int) -> None:
         self.batch_size: int = batch_size
 
-        input_shape: tuple = layers[index-1].output_shape(layers, index-1)
+        input_shape: tuple = self.previous_output_shape(layers, index)
 
         self.mask: np.ndarray = np.ndarray((batch_size, *input_shape))
 
+        self.indices: np.ndarray = np.ndarray(
+            (batch_size, *self.output_shape(layers, index)), dtype=np.intp)
+
     def output_shape(self, layers: list[Layer], current_layer_index: int) -> tuple:
-        input_shape: tuple = layers[current_layer_index -
-                                    1].output_shape(layers, current_layer_index-1) if self.input_shape is None else self.input_shape
-        self.output_shape_value: tuple = math.ceil(
-            (input_shape - self.kernel_size + 1) / self.strides)
+        input_shape: tuple = self.previous_output_shape(
+            layers, current_layer_index) if self.input_shape is None else self.input_shape
+        self.output_shape_value: tuple = (
+            (input_shape[0] - self.pool_size) // self.strides + 1, input_shape[-1])
         return self.output_shape_value
 
     def __repr__(self) -> str:
-        return f"{self.name} (Pool1D){' ' * (28 - len(self.name) - 11)}{(None, self.output_shape_value)}{' ' * (26-len(f'(None, {self.output_shape_value})'))}0\n"
+        formatted_output = f'(None, {", ".join(map(str, self.output_shape_value))})'
+        return f"{self.name} (Pool1D){' ' * (28 - len(self.name) - 11)}{formatted_output}{' ' * (26-len(formatted_output))}0\n"
 
     def __call__(self, x: np.ndarray, option: str, is_training: bool = False) -> np.ndarray:
         """Call function for the Pool1D layers. It reduces the size of an array by how much the kernel_size and strides is set to.
@@ -54,30 +58,33 @@ class PoolingLayey1D(Layer):
         """
         self.inputs: np.ndarray = x
 
-        x_shape: tuple = x.shape
-        height: int = (x_shape[0] - self.pool_size[0]) // self.strides[0] + 1
-        channels: int = x_shape[1]
+        if _kernels.USE_NUMBA:
+            height: int = (x.shape[0] - self.pool_size) // self.strides + 1
+            output: np.ndarray = np.empty((height, x.shape[1]), x.dtype)
+            indices: np.ndarray = np.empty(output.shape, np.intp)
 
-        mask: np.ndarray = np.zeros_like(self.inputs)
-        output: np.ndarray = np.zeros((height, channels))
+            _kernels.pool1d_forward(
+                x, self.pool_size, self.strides, option == "max", output, indices)
+        else:
+            # Windows have the shape (height, channels, pool_size), where height is the output steps
+            # Slicing the sliding window view with strides drops the ragged tail windows
+            windows: np.ndarray = sliding_window_view(
+                x, self.pool_size, axis=0)[::self.strides]
+            height: int = windows.shape[0]
 
-        for c in range(channels):
-            for i in range(height):
-                i_start: int = i * self.strides[0]
-                i_end: int = i_start + self.pool_size[0]
+            indices: np.ndarray = np.argmax(
+                windows, axis=-1) if option == "max" else np.argmin(windows, axis=-1)
+            # Converting window offsets into step indices of the input
+            indices += np.arange(height).reshape(-1, 1) * self.strides
 
-                subarray: np.ndarray = x[i_start:i_end, c]
-                index: np.int_ = np.argmax(
-                    subarray) if option == "max" else np.argmin(subarray)
-
-                index = np.unravel_index(index, subarray.shape)
-
-                mask[index[0], c] = 1
-
-                output[i, c] = x[index[0], c]
+            output: np.ndarray = np.take_along_axis(x, indices, axis=0)
 
         if is_training:
+            mask: np.ndarray = np.zeros_like(x)
+            np.put_along_axis(mask, indices, 1, axis=0)
+
             self.mask[self.current_batch] = mask
+            self.indices[self.current_batch] = indices
             self.current_batch += 1
 
         return output
@@ -137,17 +144,20 @@ class PoolingLayey2D(Layer):
     def set_batch_size(self, batch_size: int, layers: list, index: int) -> None:
         self.batch_size: int = batch_size
 
-        input_shape: tuple = layers[index-1].output_shape(
-            layers, index-1) if self.input_shape is None else self.input_shape
+        input_shape: tuple = self.previous_output_shape(
+            layers, index) if self.input_shape is None else self.input_shape
 
         self.mask: np.ndarray = np.ndarray((batch_size, *input_shape))
 
+        self.indices: np.ndarray = np.ndarray(
+            (batch_size, *self.output_shape(layers, index)), dtype=np.intp)
+
     def output_shape(self, layers: list[Layer], current_layer_index: int) -> tuple:
-        input_shape = layers[current_layer_index -
-                             1].output_shape(layers, current_layer_index-1) if self.input_shape is None else self.input_shape
+        input_shape = self.previous_output_shape(
+            layers, current_layer_index) if self.input_shape is None else self.input_shape
 
-        self.output_shape_value: tuple = tuple([math.floor(
-            (input_shape[i] - self.pool_size[i]) / self.strides[i]) + 1 for i in range(2)])
+        self.output_shape_value: tuple = tuple(
+            [(input_shape[i] - self.pool_size[i]) // self.strides[i] + 1 for i in range(2)])
 
         if len(input_shape) > 2:
             self.output_shape_value += (input_shape[-1],)
@@ -169,56 +179,43 @@ class PoolingLayey2D(Layer):
         Returns:
             np.ndarray: Array with reduced size
         """
-        shape = x.shape
-        height = (shape[0] - self.pool_size[0]) // self.strides[0] + 1
-        width = (shape[1] - self.pool_size[1]) // self.strides[1] + 1
-
-        output = np.ndarray((height, width, shape[2]))
-        mask = np.zeros_like(x)
-
-        out_shape = ((shape[0] - self.pool_size[0])//self.strides[0] + 1,
-                     (shape[1] - self.pool_size[1])//self.strides[1] + 1) + self.pool_size
-
-        out_strides = (self.strides[0]*x.strides[0], self.strides[1]
-                       * x.strides[1]) + (x.strides[0], x.strides[1])
-
-        for channel in range(shape[2]):
-            subarray = x[:, :, channel]
-
-            x_s = as_strided(subarray, shape=out_shape, strides=out_strides)
-
-            vals = np.max(x_s, axis=(-1, -2)
-                          ) if option == "max" else np.min(x_s, axis=(-1, -2))
-
-            output[:, :, channel] = vals
-
-            vals: np.ndarray = np.repeat(
-                np.repeat(vals, 2, axis=0), 2, axis=1)
-
-            # Handlign the shape of vals and mask
-            if subarray.shape[0] != vals.shape[0]:
-                if subarray.shape[0] != mask.shape[0]:
-                    subarray = subarray[:-1, :-1]
-                else:
-                    extra_dim_0: np.ndarray = np.zeros(
-                        (1, vals.shape[1]))
-                    extra_dim_1: np.ndarray = np.zeros(
-                        (vals.shape[0] + 1, 1))
-
-                    vals = np.concatenate(
-                        (extra_dim_1, np.concatenate((extra_dim_0, vals), axis=0)), axis=1)
-
-            mask[:, :, channel] = (subarray == vals)
+        if _kernels.USE_NUMBA:
+            height: int = (x.shape[0] - self.pool_size[0]) // self.strides[0] + 1
+            width: int = (x.shape[1] - self.pool_size[1]) // self.strides[1] + 1
+            output: np.ndarray = np.empty((height, width, x.shape[2]), x.dtype)
+            indices: np.ndarray = np.empty(output.shape, np.intp)
+
+            _kernels.pool2d_forward(x, self.pool_size[0], self.pool_size[1],
+                                    self.strides[0], self.strides[1], option == "max", output, indices)
+        else:
+            # Windows have the shape (height, width, channels, pool_size[0], pool_size[1])
+            windows: np.ndarray = sliding_window_view(
+                x, self.pool_size, axis=(0, 1))[::self.strides[0], ::self.strides[1]]
+            height, width, channels = windows.shape[:3]
+
+            windows = windows.reshape(height, width, channels, -1)
+            window_indices: np.ndarray = np.argmax(
+                windows, axis=-1) if option == "max" else np.argmin(windows, axis=-1)
+
+            # Converting the indices inside of the windows into indices of the flattened input
+            rows, cols = np.divmod(window_indices, self.pool_size[1])
+            rows += np.arange(height).reshape(-1, 1, 1) * self.strides[0]
+            cols += np.arange(width).reshape(1, -1, 1) * self.strides[1]
+
+            indices: np.ndarray = np.ravel_multi_index(
+                (rows, cols, np.arange(channels)), x.shape)
+
+            output: np.ndarray = np.take(x, indices)
 
         if is_training:
-            self.mask[self.current_batch] = mask
+            self.indices[self.current_batch] = indices
             self.inputs = x
             self.current_batch += 1
 
         return output
 
     def backpropagate(self, gradient: np.ndarray, optimizer: list[Optimizer]) -> np.ndarray:
-        """Backpropagate algorithm used for Pooling2D layers.
+        """Backpropagate algorithm used for Pooling2D layers. We scatter the gradient to the input positions picked during the feed forward
 
         Args:
             gradient (np.ndarray): Gradient calculated by loss.compute_derivative() or previous layers output gradient
@@ -228,32 +225,16 @@ class PoolingLayey2D(Layer):
         Returns:
             np.ndarray: Output gradient
         """
-        gradient_shape: tuple = gradient.shape
-        channels: int = gradient_shape[2]
-        gradient_expended: bool = False
-        mask = np.average(self.mask, 0)
-
-        if (gradient_shape[0] * 2 < self.inputs.shape[0]):
-            gradient_expended = True
+        delta: np.ndarray = np.zeros(self.inputs.size)
 
-            extra_dim_0: np.ndarray = np.zeros(
-                (1, gradient_shape[1], channels))
-            extra_dim_1: np.ndarray = np.zeros(
-                (gradient_shape[0] + 1, 1, channels))
-
-            gradient = np.concatenate(
-                (extra_dim_1, np.concatenate((extra_dim_0, gradient), axis=0)), axis=1)
-
-        delta: np.ndarray = np.repeat(
-            np.repeat(gradient, 2, axis=0), 2, axis=1)
+        np.add.at(delta, self.indices.ravel(), np.tile(
+            gradient.ravel(), self.batch_size))
 
-        if gradient_expended:
-            d_shape: tuple = delta.shape
-            delta = delta[0:d_shape[0]-1, 0:d_shape[1]-1, :]
+        delta /= self.batch_size
 
         self.current_batch = 0
 
-        return delta * mask
+        return delta.reshape(self.inputs.shape)
 
 
 class MaxPool1D(PoolingLayey1D):
@@ -261,7 +242,8 @@ class MaxPool1D(PoolingLayey1D):
     """
 
     def __repr__(self) -> str:
-        return f"{self.name} (MaxPool1D){' ' * (28 - len(self.name) - 11)}{(None, self.output_shape_value)}{' ' * (26-len(f'(None, {self.output_shape_value})'))}0\n"
+        formatted_output = f'(None, {", ".join(map(str, self.output_shape_value))})'
+        return f"{self.name} (MaxPool1D){' ' * (28 - len(self.name) - 11)}{formatted_output}{' ' * (26-len(formatted_output))}0\n"
 
     def __call__(self, x: np.ndarray, is_training: bool = False) -> np.ndarray:
         return super().__call__(x, "max", is_training)
@@ -284,7 +266,8 @@ class MinPool1D(PoolingLayey1D):
     """
 
     def __repr__(self) -> str:
-        return f"{self.name} (MinPool1D){' ' * (28 - len(self.name) - 11)}{(None, self.output_shape_value)}{' ' * (26-len(f'(None, {self.output_shape_value})'))}0\n"
+        formatted_output = f'(None, {", ".join(map(str, self.output_shape_value))})'
+        return f"{self.name} (MinPool1D){' ' * (28 - len(self.name) - 11)}{formatted_output}{' ' * (26-len(formatted_output))}0\n"
 
     def __call__(self, x: np.ndarray, is_training: bool = False) -> np.ndarray:
         return super().__call__(x, "min", is_training)
@@ -307,7 +290,8 @@ class AvgPool1D(PoolingLayey1D):
     """
 
     def __repr__(self) -> str:
-        return f"{self.name} (AvgPool1D){' ' * (28 - len(self.name) - 11)}{(None, self.output_shape_value)}{' ' * (26-len(f'(None, {self.output_shape_value})'))}0\n"
+        formatted_output = f'(None, {", ".join(map(str, self.output_shape_value))})'
+        return f"{self.name} (AvgPool1D){' ' * (28 - len(self.name) - 11)}{formatted_output}{' ' * (26-len(formatted_output))}0\n"
 
     def __call__(self, x: np.ndarray, is_training: bool = False) -> np.ndarray:
         self.inputs: np.ndarray = x
@@ -380,3 +364,41 @@ class AvgPool2D(PoolingLayey2D):
             self.current_batch += 1
 
         return output
+
+    def backpropagate(self, gradient: np.ndarray, optimizer: list[Optimizer]) -> np.ndarray:
+        """Backpropagate algorithm used for AvgPool2D layer.
+
+        Args:
+            gradient (np.ndarray): Gradient calculated by loss.compute_derivative() or previous layers output gradient
+            optimizer (List[Optimizer]): Optimizer to use for updating the model's parameters. Note that we use 2 different optimizers as then we don't have to check a bunch of times 
+            wheter we use 1 or 2 optimizers, and we need 2 optimizers for CNNs
+
+        Returns:
+            np.ndarray: Output gradient
+        """
+        gradient_shape: tuple = gradient.shape
+        channels: int = gradient_shape[2]
+        gradient_expended: bool = False
+        mask = np.average(self.mask, 0)
+
+        if (gradient_shape[0] * 2 < self.inputs.shape[0]):
+            gradient_expended = True
+
+            extra_dim_0: np.ndarray = np.zeros(
+                (1, gradient_shape[1], channels))
+            extra_dim_1: np.ndarray = np.zeros(
+                (gradient_shape[0] + 1, 1, channels))
+
+            gradient = np.concatenate(
+                (extra_dim_1, np.concatenate((extra_dim_0, gradient), axis=0)), axis=1)
+
+        delta: np.ndarray = np.repeat(
+            np.repeat(gradient, 2, axis=0), 2, axis=1)
+
+        if gradient_expended:
+            d_shape: tuple = delta.shape
+            delta = delta[0:d_shape[0]-1, 0:d_shape[1]-1, :]
+
+        self.current_batch = 0
+
+        return delta * mask
@@ -1,7 +1,7 @@
 import numpy as np
 from nano_keras.losses import LOSS_FUNCTIONS, Loss
 from nano_keras.optimizers import OPTIMIZERS, Optimizer
-from nano_keras.layers import Layer, LayerWithParams, LSTM, GRU, MultiHeadAttention
+from nano_keras.layers import Layer, LayerWithParams, LSTM, GRU, MultiHeadAttention, Conv2D, MaxPool2D
 from nano_keras.callbacks import Callback
 from copy import deepcopy
 from time import time
@@ -41,6 +41,8 @@ class NN:
         self.accuracy: float = 0
         self.val_loss: float = None
         self.val_accuracy: float = None
+        self.backend: str = "numpy"
+        self._jax_params: list = None
 
     @staticmethod
     def __convert_size(size: int) -> str:
@@ -150,6 +152,8 @@ class NN:
                 print(f"Exception occured when setting weights: {e}")
                 exit(1)
 
+        self._jax_params = None
+
     def add(self, layer: Layer):
         """Adds a custom layer to the NN.
 
@@ -210,27 +214,60 @@ class NN:
                         f"Exception encountered when creating weights: {e}\nChange your achitecture and try again. If you think it's an error post an issue on github")
                     exit(1)
 
-    def compile(self, loss_function: Loss | str = "mse", optimizer: Optimizer | str = "adam", metrics: str = "", weight_data_type: np.float_ = np.float32, bias_data_type: np.float_ = np.float32) -> None:
+    def compile(self, loss_function: Loss | str = "mse", optimizer: Optimizer | str = "adam", metrics: str = "", weight_data_type: np.float_ = np.float32, bias_data_type: np.float_ = np.float32, backend: str = "numpy") -> None:
         """Function you should call before starting training the model, as we generate the weights in here, set the loss function and optimizer.
 
         Args:
             loss_function (Loss | str, optional): Loss function the model should use. You can pass either the name of it as a str or intialized class. Defaults to "mse".
             optimizer (Optimizer | str, optional): Optimizer the model should use when updating it's params. You can pass either the name of it as a str or initalized class. Defaults to "adam"
             metrics (str, optional): Paramter that specifies what metrics should the model use. Possible metrics are: accuracy. Defaults to "".
-            weight_data_type (np.float_, optional): Data type you want the models weights to be. Use np.float_ types like np.float32 or np.float64. Defaults to np.float32.
+            weight_data_type (np.float_, optional): Data type you want the models weights to be. Use np.float_ types like np.float16, np.float32 or np.float64.
+            Dense and Conv1D layers only store np.float16 weights and compute in np.float32. Defaults to np.float32.
             bias_data_type (np.float_, optional): Data type you want the models biases to be. Use np.float_ types like np.float32 or np.float64. Defaults to np.float32.
+            backend (str, optional): Backend used for the inference feed forward. Possible backends are: numpy, jax. The jax backend compiles the feed forward with jax.jit
+            and only supports Input, Dense, Dropout, Conv1D, Flatten and Reshape layers. Training always uses numpy. Defaults to "numpy".
+
+        Raises:
+            ValueError: If the backend isn't supported
         """
-        self.loss_function: Loss = LOSS_FUNCTIONS[loss_function] if type(
-            loss_function) == str else loss_function
+        self.loss_function: Loss = LOSS_FUNCTIONS[loss_function] if isinstance(
+            loss_function, str) else loss_function
 
-        self.optimizer: Optimizer = OPTIMIZERS[optimizer] if type(
-            optimizer) == str else optimizer
+        self.optimizer: Optimizer = OPTIMIZERS[optimizer] if isinstance(
+            optimizer, str) else optimizer
         optimizer4d = deepcopy(self.optimizer)
         self.optimizer: list[Optimizer] = [self.optimizer, optimizer4d]
 
         self.metrics: str = metrics
+
+        # Clearing the cached output shapes in case the layers were changed since the last compile
+        for layer in self.layers:
+            layer._output_shape_cache = None
+
         self.generate_weights(weight_data_type, bias_data_type)
 
+        for i, layer in enumerate(self.layers):
+            layer.bind_buffers(self.layers, i)
+
+        # Fusing Conv2D with the MaxPool2D after it, so the inference feed forward doesn't create the whole Conv2D output
+        for layer, next_layer in zip(self.layers, self.layers[1:] + [None]):
+            if isinstance(layer, Conv2D):
+                layer.fused_pool = None
+                if isinstance(next_layer, MaxPool2D):
+                    layer.fuse_pool(next_layer)
+
+        if backend not in ("numpy", "jax"):
+            raise ValueError(
+                f"Backend {backend} isn't supported. Possible backends are: numpy, jax")
+
+        self.backend: str = backend
+        self._jax_params: list = None
+
+        if backend == "jax":
+            from nano_keras import jax_backend
+            self._jax_feed_forward = jax_backend.build_feed_forward(
+                self.layers)
+
     def feed_forward(self, x: np.ndarray, is_training: bool = False) -> np.ndarray:
         """Feed forward for the whole model
 
@@ -241,9 +278,25 @@ class NN:
         Returns:
             np.ndarray: output of the model
         """
-        for layer in self.layers:
+        if self.backend == "jax" and not is_training:
+            if self._jax_params is None:
+                from nano_keras import jax_backend
+                # The params are converted lazily, as they change after every batch during training
+                self._jax_params = jax_backend.get_params(self.layers)
+            return np.asarray(self._jax_feed_forward(self._jax_params, x))
+
+        layers = iter(self.layers)
+        for layer in layers:
+            if not is_training and isinstance(layer, Conv2D) and layer.fused_pool is not None:
+                # The fused MaxPool2D layer right after Conv2D is already applied by forward_into_pool, so it's skipped
+                x = layer.forward_into_pool(x)
+                next(layers)
+                continue
+
             x = layer(x, is_training)
-        return x
+
+        # During inference the last layer can return one of it's buffers, which would be overwritten by the next call
+        return x if is_training else x.copy()
 
     def backpropagate(self, X: np.ndarray, y: np.ndarray, verbose: int = 2, epoch: int = 1, total_epochs: int = 100) -> None:
         """Backpropgate function to make the train function cleaner and better for future expansion
@@ -263,9 +316,13 @@ class NN:
         for batch in range(batches):
             start = time()
             gradient = []
-            for _ in range(self.batch_size):
-                yPred = self.feed_forward(X[current_index], True)
 
+            # The whole batch goes through every layer at once, so layers like Dense compute a single matrix multiplication for it
+            yPreds = X[current_index:current_index+self.batch_size]
+            for layer in self.layers:
+                yPreds = layer.forward_batch(yPreds)
+
+            for yPred in yPreds:
                 if self.metrics == "accuracy":
                     total_accuracy += self.__calculate_accuracy(
                         yPred, y[current_index])
@@ -282,6 +339,8 @@ class NN:
             for layer in self.layers[-1::-1]:
                 gradient = layer.backpropagate(gradient, self.optimizer)
 
+            self._jax_params = None
+
             accuracy = total_accuracy / \
                 (current_index+1) if self.metrics == "accuracy" else None
             time_taken = time() - start
@@ -408,10 +467,23 @@ class NN:
         Returns:
             tuple: loss, accuracy. Accuracy is None if the metrics in NN.compile() isn't set to accuracy 
         """
-        yPreds = np.ndarray((X.shape[0], self.layers[-1].units))
+        if self.backend == "jax":
+            yPreds = np.ndarray((X.shape[0], self.layers[-1].units))
 
-        for i, x in enumerate(X):
-            yPreds[i] = self.feed_forward(x, False)
+            for i, x in enumerate(X):
+                yPreds[i] = self.feed_forward(x, False)
+        else:
+            # The whole dataset goes through every layer at once, so Dense computes a single matrix multiplication instead of one for every sample
+            yPreds = X
+            layers = iter(self.layers)
+            for layer in layers:
+                if isinstance(layer, Conv2D) and layer.fused_pool is not None:
+                    yPreds = np.stack([layer.forward_into_pool(sample)
+                                      for sample in yPreds])
+                    next(layers)
+                    continue
+
+                yPreds = layer.predict_batch(yPreds)
 
         if show_preds:
             print(yPreds)
@@ -448,4 +520,5 @@ class NN:
         for i in range(len(weights)):
             self.layers[i].set_weights(*weights[i])
 
+        self._jax_params = None
         return
@@ -1,5 +1,6 @@
 import numpy as np
 from nano_keras.optimizers import Optimizer
+from nano_keras import _kernels
 
 
 class AdaMax(Optimizer):
@@ -28,6 +29,55 @@ class AdaMax(Optimizer):
         self.u_b: np.ndarray = np.array([])
         self.t: int = 0
 
+        # Scratch buffer for the NumPy update step, so it doesn't have to be allocated on every call
+        self._tmp: np.ndarray = np.array([])
+
+    def _update(self, m: np.ndarray, u: np.ndarray, gradients: np.ndarray, params: np.ndarray, learning_rate: float) -> None:
+        """Support function that updates the moments and the params in place
+
+        Args:
+            m (np.ndarray): Exponential moving average of the gradient
+            u (np.ndarray): Exponentially weighted infinity norm of the gradient
+            gradients (np.ndarray): Gradients of the params
+            params (np.ndarray): Params to update
+            learning_rate (float): Learning rate with the bias correction already applied
+        """
+        # The Numba kernel reads every array once, but it needs flat views of them. Numba also doesn't support float16
+        if _kernels.USE_NUMBA and gradients.shape == params.shape and params.dtype != np.float16 \
+                and all(array.flags.c_contiguous and array.shape == params.shape for array in (m, u, params)):
+            _kernels.adamax_step(m.reshape(-1), u.reshape(-1), np.ascontiguousarray(gradients).reshape(-1),
+                                 params.reshape(-1), self.beta1, self.beta2, learning_rate, self.e)
+            return
+
+        # We use in-place ufuncs as the optimizer is memory bound and temporary arrays would dominate the runtime
+        np.multiply(m, self.beta1, out=m)
+        m += (1 - self.beta1) * gradients
+        np.multiply(u, self.beta2, out=u)
+        np.maximum(u, np.abs(gradients), out=u)
+
+        if self._tmp.size < m.size or self._tmp.dtype != m.dtype:
+            self._tmp = np.empty(m.size, m.dtype)
+
+        tmp = self._tmp[:m.size].reshape(m.shape)
+
+        np.add(u, self.e, out=tmp)
+        np.divide(m, tmp, out=tmp)
+        tmp *= learning_rate
+
+        params += tmp
+
+    def init_state(self, weights: np.ndarray, biases: np.ndarray) -> None:
+        """Function that allocates the moving averages of the optimizer at the shapes of the params
+
+        Args:
+            weights (np.ndarray): Weights the optimizer will update
+            biases (np.ndarray): Biases the optimizer will update
+        """
+        self.m_w = np.zeros_like(weights)
+        self.u_w = np.zeros_like(weights)
+        self.m_b = np.zeros_like(biases)
+        self.u_b = np.zeros_like(biases)
+
     def apply_gradients(self, weightGradients: np.ndarray, biasGradients: np.ndarray, weights: np.ndarray, biases: np.ndarray, update_biases: bool = True) -> tuple[np.ndarray, np.ndarray]:
         """Function that updates params using provided gradients and AdaMax algorithm. You can read more about it
         at https://paperswithcode.com/method/adamax
@@ -46,38 +96,28 @@ class AdaMax(Optimizer):
         beta1T = self.beta1 ** self.t
 
         if self.m_w.size == 0:
-            self.m_w = np.zeros_like(weights)
-            self.u_w = np.zeros_like(weights)
-            self.m_b = np.zeros_like(biases)
-            self.u_b = np.zeros_like(biases)
-
-        target_shape = weights.shape
+            self.init_state(weights, biases)
 
-        # Adjusting shapes before calculations
-        slices = [slice(0, shape) for shape in target_shape]
+        # The state only has to be adjusted if the optimizer is shared between layers with different shapes.
+        # Otherwise it already has the shape of the weights, so we skip the padding as it would copy the state on every step
+        if self.m_w.shape != weights.shape:
+            slices = tuple(slice(0, shape) for shape in weights.shape)
 
-        self.m_w = self._fill_array(self.m_w, target_shape)[tuple(slices)]
-        self.u_w = self._fill_array(self.u_w, target_shape)[tuple(slices)]
+            self.m_w = self._fill_array(self.m_w, weights.shape)[slices]
+            self.u_w = self._fill_array(self.u_w, weights.shape)[slices]
 
-        # Calculations
-        self.m_w = self.beta1 * self.m_w + (1 - self.beta1) * weightGradients
-        self.u_w = np.maximum(self.beta2 * self.u_w, np.abs(weightGradients))
-
-        weights += (self.learning_rate / (1 - beta1T)) * \
-            (self.m_w / (self.u_w + self.e))
+        self._update(self.m_w, self.u_w, weightGradients, weights,
+                     self.learning_rate / (1 - beta1T))
 
         if update_biases:
-            if self.adjust_biases_shape:
+            if self.adjust_biases_shape and self.m_b.shape != biases.shape:
                 target_shape = biases.shape
                 self.m_b = self._fill_array(self.m_b, target_shape)[
                     :target_shape[0]]
                 self.u_b = self._fill_array(self.u_b, target_shape)[
                     :target_shape[0]]
 
-            self.m_b = self.beta1 * self.m_b + (1 - self.beta1) * biasGradients
-            self.u_b = np.maximum(self.beta2 * self.u_b, np.abs(biasGradients))
-
-            biases += (self.learning_rate / (1 - beta1T)) * \
-                (self.m_b / (self.u_b + self.e))
+            self._update(self.m_b, self.u_b, biasGradients, biases,
+                         self.learning_rate / (1 - beta1T))
 
         return (weights, biases)